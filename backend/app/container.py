@@ -0,0 +1,138 @@
+"""Composition root wiring infrastructure adapters into application services."""
+
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import yaml
+
+from backend.application.inspection_service import (
+    BusinessRulesEngine,
+    Classifier,
+    Detector,
+    InspectionService,
+)
+from backend.application.tiled_detection import TiledDetector
+from backend.application.verdict_statistics import VerdictStatistics
+from backend.core.config import RTSPSource, Settings
+from backend.infrastructure.frame_channel import SharedFramePublisher
+from backend.infrastructure.statistics_store import JsonStatisticsStore
+
+SETTINGS_ENV = "RQI_SETTINGS"
+
+logger = logging.getLogger(__name__)
+
+
+def load_settings(path: Optional[Path] = None) -> Settings:
+    """Load settings from ``path`` or the YAML file named by ``RQI_SETTINGS``.
+
+    Defaults are used when neither is provided.
+    """
+
+    if path is None and os.environ.get(SETTINGS_ENV):
+        path = Path(os.environ[SETTINGS_ENV])
+    if path is None:
+        return Settings()
+    with Path(path).open(encoding="utf-8") as handle:
+        return Settings.from_dict(yaml.safe_load(handle) or {})
+
+
+@dataclass
+class Container:
+    """Holds the process-wide adapters shared by the API and inspection workers.
+
+    Inspection workers running in the API process must build their services
+    through :meth:`inspection_service` so that every verdict reaches the NG
+    statistics and the live view channels.
+    """
+
+    settings: Settings
+    publisher: Optional[SharedFramePublisher] = None
+    statistics: VerdictStatistics = field(init=False)
+
+    def __post_init__(self) -> None:
+        config = self.settings.statistics
+        assert config.snapshot_path is not None
+        self.statistics = VerdictStatistics(config, store=JsonStatisticsStore(config.snapshot_path))
+
+    def start(self) -> None:
+        """Restore persisted statistics and create the live view channels.
+
+        An unreadable or incompatible snapshot is logged and statistics start
+        empty instead of preventing startup; the next compaction replaces it.
+        """
+
+        try:
+            self.statistics.load()
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning(
+                "Ignoring statistics snapshot %s: %s", self.settings.statistics.snapshot_path, exc
+            )
+        if self.publisher is None:
+            self.publisher = SharedFramePublisher(self.settings.rtsp_sources)
+
+    def stop(self) -> None:
+        """Persist statistics and release the live view channels."""
+
+        self.statistics.compact()
+        if self.publisher is not None:
+            self.publisher.close()
+            self.publisher = None
+
+    def inspection_service(
+        self,
+        detector: Detector,
+        classifier: Classifier,
+        rules_engine: BusinessRulesEngine,
+        camera: Optional[str] = None,
+    ) -> InspectionService:
+        """Build an inspection service connected to the shared adapters.
+
+        When ``Settings.tiling`` is configured and ``camera`` names a source
+        with a frame geometry, ``detector`` must also be a batch detector and is
+        wrapped in a :class:`TiledDetector` for that camera's frames.
+        """
+
+        source = self._source(camera)
+        if self.settings.tiling is not None and source is not None and source.frame_width:
+            detector = self._tiled(detector, source)
+        return InspectionService(
+            detector=detector,
+            classifier=classifier,
+            rules_engine=rules_engine,
+            recorder=self.statistics,
+            publisher=self.publisher,
+        )
+
+    def _source(self, camera: Optional[str]) -> Optional[RTSPSource]:
+        """Return the configured source named ``camera``, if any."""
+
+        return next((source for source in self.settings.rtsp_sources if source.name == camera), None)
+
+    def _tiled(self, detector: Detector, source: RTSPSource) -> TiledDetector:
+        """Wrap ``detector`` for tiled inference over frames of ``source``."""
+
+        tiling = self.settings.tiling
+        assert tiling is not None and source.frame_width and source.frame_height
+        if not hasattr(detector, "detect_batch"):
+            raise ValueError(f"Tiling for camera {source.name} requires a batch detector")
+        if self.settings.model is not None:
+            return TiledDetector.from_config(
+                detector,
+                self.settings.model,
+                tiling,
+                source.frame_width,
+                source.frame_height,
+                source.channels,
+            )
+        return TiledDetector(
+            detector=detector,
+            frame_width=source.frame_width,
+            frame_height=source.frame_height,
+            channels=source.channels,
+            tiling=tiling,
+        )
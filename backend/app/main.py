@@ -2,9 +2,31 @@
 
 from __future__ import annotations
 
-from fastapi import FastAPI
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from fastapi import FastAPI, HTTPException
+
+from backend.app.container import Container, load_settings
+from backend.application.verdict_statistics import GRANULARITIES, build_control_chart, local_time
+from backend.interfaces.statistics import StatisticsDTO
 
 app = FastAPI(title="Realtime Quality Inspection API")
+container = Container(settings=load_settings())
+
+
+@app.on_event("startup")
+async def start_container() -> None:
+    """Restore statistics and open the live view channels."""
+
+    container.start()
+
+
+@app.on_event("shutdown")
+async def stop_container() -> None:
+    """Compact statistics to disk and release channels when the API stops."""
+
+    container.stop()
 
 
 @app.get("/health", tags=["system"])
@@ -12,3 +34,27 @@ async def health_check() -> dict[str, str]:
     """Simple health endpoint for availability checks."""
 
     return {"status": "ok"}
+
+
+@app.get("/statistics/ng", tags=["statistics"])
+async def ng_statistics(
+    granularity: str = "hour",
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    camera: Optional[str] = None,
+    label: Optional[str] = None,
+    source: Optional[str] = None,
+) -> dict[str, Any]:
+    """Return NG rates per bucket with p-chart control limits.
+
+    Defaults to the last 24 hours when no range is given. Timezone-aware
+    bounds are converted to the local time buckets are keyed by.
+    """
+
+    if granularity not in GRANULARITIES:
+        raise HTTPException(status_code=422, detail=f"Unknown granularity: {granularity}")
+    end = local_time(end) if end is not None else datetime.now()
+    start = local_time(start) if start is not None else end - timedelta(days=1)
+    buckets = container.statistics.query(granularity, start, end, camera=camera, label=label, source=source)
+    chart = build_control_chart(buckets)
+    return StatisticsDTO.from_domain(granularity, buckets, chart).model_dump()
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Protocol
+from datetime import datetime
+from typing import Iterable, Optional, Protocol, Sequence
 
 from backend.domain.entities import ClassificationResult, DetectionResult, InspectionVerdict
 
@@ -33,6 +34,26 @@ class BusinessRulesEngine(Protocol):
         """Combine detection and classification results into a final verdict."""
 
 
+class VerdictRecorder(Protocol):
+    """Protocol for sinks consuming the stream of inspection verdicts."""
+
+    def record(self, verdict: InspectionVerdict, camera: str, timestamp: datetime) -> None:
+        """Record a verdict produced for ``camera`` at ``timestamp``."""
+
+
+class FramePublisher(Protocol):
+    """Protocol for sinks forwarding inspected frames to live viewers."""
+
+    def publish(
+        self,
+        camera: str,
+        frame: bytes,
+        verdict: InspectionVerdict,
+        detections: Sequence[DetectionResult],
+    ) -> None:
+        """Publish an inspected frame together with its verdict and detections."""
+
+
 @dataclass
 class InspectionService:
     """Coordinates detection, classification, and business logic."""
@@ -40,11 +61,18 @@ class InspectionService:
     detector: Detector
     classifier: Classifier
     rules_engine: BusinessRulesEngine
+    recorder: Optional[VerdictRecorder] = None
+    publisher: Optional[FramePublisher] = None
 
-    def run(self, frame: bytes) -> InspectionVerdict:
+    def run(self, frame: bytes, camera: str = "default") -> InspectionVerdict:
         """Execute the inspection pipeline for a single frame."""
 
         detections = list(self.detector.detect(frame))
         crops = [detection.crop for detection in detections if detection.crop is not None]
         classifications = list(self.classifier.classify(crops)) if crops else []
-        return self.rules_engine.evaluate(detections, classifications)
+        verdict = self.rules_engine.evaluate(detections, classifications)
+        if self.recorder is not None:
+            self.recorder.record(verdict, camera=camera, timestamp=datetime.now())
+        if self.publisher is not None:
+            self.publisher.publish(camera, frame, verdict, detections)
+        return verdict
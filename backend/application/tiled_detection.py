@@ -0,0 +1,293 @@
+"""Tiled inference for frames that exceed the detector input resolution."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+from typing import Iterable, List, Optional, Protocol, Sequence
+
+from backend.core.config import ModelConfig, TilingConfig
+from backend.domain.entities import BoundingBox, DetectionResult
+
+_BINARY = bytes([0] + [1] * 255)
+
+
+class BatchDetector(Protocol):
+    """Protocol for segmentation detectors able to process several tiles per call."""
+
+    def detect_batch(self, tiles: Sequence[bytes]) -> Sequence[Iterable[DetectionResult]]:
+        """Run segmentation on equally sized tiles and return detections per tile.
+
+        Detection boxes are expected in tile coordinates.
+        """
+
+
+@dataclass(frozen=True)
+class Tile:
+    """Region of a frame processed as a single detector input."""
+
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+@dataclass(frozen=True)
+class _PlacedDetection:
+    """Detection translated to frame coordinates with seam metadata."""
+
+    detection: DetectionResult
+    truncated: bool
+
+
+def plan_tiles(frame_width: int, frame_height: int, tiling: TilingConfig) -> List[Tile]:
+    """Split a frame into overlapping tiles of identical size.
+
+    The last tile on each axis is shifted inwards so that it ends on the frame
+    border, which keeps every tile the same shape for batched inference. Frames
+    smaller than a tile along an axis are covered by a single, smaller tile.
+    """
+
+    width = min(tiling.tile_width, frame_width)
+    height = min(tiling.tile_height, frame_height)
+    return [
+        Tile(x=x, y=y, width=width, height=height)
+        for y in _axis_offsets(frame_height, height, tiling.overlap)
+        for x in _axis_offsets(frame_width, width, tiling.overlap)
+    ]
+
+
+def _merge_detections(
+    detections: Iterable[_PlacedDetection], iou_threshold: float
+) -> List[DetectionResult]:
+    """Merge duplicate and seam-split detections with greedy, label-aware NMS.
+
+    Detections are visited in descending confidence. A detection is folded into
+    an already kept one of the same label when their boxes reach
+    ``iou_threshold``. When a seam cut either of them, the overlap is also
+    measured against the smaller box, and two cut pieces are joined when their
+    masks share foreground pixels. Folding unions the boxes and masks while
+    keeping the confidence of the stronger detection; the crop of an uncut
+    detection is preferred over that of a fragment.
+    """
+
+    ordered = sorted(detections, key=lambda placed: placed.detection.confidence, reverse=True)
+    kept: List[_PlacedDetection] = []
+    for candidate in ordered:
+        for index, existing in enumerate(kept):
+            if _should_merge(existing, candidate, iou_threshold):
+                kept[index] = _stitch(existing, candidate)
+                break
+        else:
+            kept.append(candidate)
+    return [placed.detection for placed in kept]
+
+
+@dataclass
+class TiledDetector:
+    """Detector adapter running a batch detector over overlapping frame tiles.
+
+    Frames are raw row-major pixel buffers of ``frame_width`` x ``frame_height``
+    pixels with ``channels`` bytes per pixel. Only ``tiling.batch_size`` tiles
+    are materialized at a time, so memory usage is bounded by the batch size
+    rather than the frame resolution. Detections without a ``bbox`` cannot be
+    placed on the frame and are passed through unmerged.
+    """
+
+    detector: BatchDetector
+    frame_width: int
+    frame_height: int
+    channels: int = 3
+    tiling: TilingConfig = field(default_factory=TilingConfig)
+    iou_threshold: float = 0.5
+
+    @classmethod
+    def from_config(
+        cls,
+        detector: BatchDetector,
+        model: ModelConfig,
+        tiling: TilingConfig,
+        frame_width: int,
+        frame_height: int,
+        channels: int = 3,
+    ) -> "TiledDetector":
+        """Build a tiled detector using the NMS threshold of the model configuration."""
+
+        return cls(
+            detector=detector,
+            frame_width=frame_width,
+            frame_height=frame_height,
+            channels=channels,
+            tiling=tiling,
+            iou_threshold=model.iou_threshold,
+        )
+
+    def detect(self, frame: bytes) -> List[DetectionResult]:
+        """Run tiled segmentation on a frame and return merged detections."""
+
+        expected = self.frame_width * self.frame_height * self.channels
+        if len(frame) != expected:
+            raise ValueError(
+                f"Frame has {len(frame)} bytes, expected {expected} for "
+                f"{self.frame_width}x{self.frame_height}x{self.channels}"
+            )
+
+        view = memoryview(frame)
+        tiles = plan_tiles(self.frame_width, self.frame_height, self.tiling)
+        placed: List[_PlacedDetection] = []
+        unplaced: List[DetectionResult] = []
+        for start in range(0, len(tiles), self.tiling.batch_size):
+            batch = tiles[start : start + self.tiling.batch_size]
+            outputs = self.detector.detect_batch([self._extract(view, tile) for tile in batch])
+            if len(outputs) != len(batch):
+                raise ValueError(
+                    f"Detector returned {len(outputs)} results for a batch of {len(batch)} tiles"
+                )
+            for tile, detections in zip(batch, outputs):
+                for detection in detections:
+                    if detection.bbox is None:
+                        unplaced.append(detection)
+                    else:
+                        placed.append(self._place(detection, tile))
+
+        return _merge_detections(placed, self.iou_threshold) + unplaced
+
+    def _extract(self, view: memoryview, tile: Tile) -> bytes:
+        """Copy the pixels covered by ``tile`` into a contiguous buffer."""
+
+        row_stride = self.frame_width * self.channels
+        if tile.width == self.frame_width:
+            return bytes(view[tile.y * row_stride : (tile.y + tile.height) * row_stride])
+
+        start = tile.x * self.channels
+        span = tile.width * self.channels
+        return b"".join(
+            view[row * row_stride + start : row * row_stride + start + span]
+            for row in range(tile.y, tile.y + tile.height)
+        )
+
+    def _place(self, detection: DetectionResult, tile: Tile) -> _PlacedDetection:
+        """Translate a tile-local detection to frame coordinates."""
+
+        assert detection.bbox is not None
+        x, y, width, height = detection.bbox
+        truncated = (
+            (x <= 0 and tile.x > 0)
+            or (y <= 0 and tile.y > 0)
+            or (x + width >= tile.width and tile.x + tile.width < self.frame_width)
+            or (y + height >= tile.height and tile.y + tile.height < self.frame_height)
+        )
+        return _PlacedDetection(
+            detection=replace(detection, bbox=(tile.x + x, tile.y + y, width, height)),
+            truncated=truncated,
+        )
+
+
+def _axis_offsets(length: int, tile: int, overlap: int) -> List[int]:
+    """Return tile start offsets along one axis."""
+
+    if length <= tile:
+        return [0]
+    offsets = list(range(0, length - tile, tile - overlap))
+    offsets.append(length - tile)
+    return offsets
+
+
+def _intersection(a: BoundingBox, b: BoundingBox) -> Optional[BoundingBox]:
+    """Return the overlapping region of two boxes, if any."""
+
+    left = max(a[0], b[0])
+    top = max(a[1], b[1])
+    right = min(a[0] + a[2], b[0] + b[2])
+    bottom = min(a[1] + a[3], b[1] + b[3])
+    if right <= left or bottom <= top:
+        return None
+    return (left, top, right - left, bottom - top)
+
+
+def _has_valid_mask(detection: DetectionResult) -> bool:
+    """Check that the mask matches the box dimensions."""
+
+    assert detection.bbox is not None
+    return len(detection.mask) == detection.bbox[2] * detection.bbox[3]
+
+
+def _mask_row(detection: DetectionResult, row: int, left: int, width: int) -> int:
+    """Return a binarized slice of a mask row, packed into an integer."""
+
+    assert detection.bbox is not None
+    box_x, box_y, box_width, _ = detection.bbox
+    offset = (row - box_y) * box_width + (left - box_x)
+    return int.from_bytes(detection.mask[offset : offset + width].translate(_BINARY), "big")
+
+
+def _masks_touch(a: DetectionResult, b: DetectionResult, region: BoundingBox) -> bool:
+    """Check whether two masks share a foreground pixel inside ``region``."""
+
+    if not (_has_valid_mask(a) and _has_valid_mask(b)):
+        return True
+    left, top, width, height = region
+    return any(
+        _mask_row(a, row, left, width) & _mask_row(b, row, left, width)
+        for row in range(top, top + height)
+    )
+
+
+def _should_merge(a: _PlacedDetection, b: _PlacedDetection, iou_threshold: float) -> bool:
+    """Decide whether two placed detections describe the same object."""
+
+    if a.detection.label != b.detection.label:
+        return False
+    assert a.detection.bbox is not None and b.detection.bbox is not None
+    region = _intersection(a.detection.bbox, b.detection.bbox)
+    if region is None:
+        return False
+
+    overlap = region[2] * region[3]
+    area_a = a.detection.bbox[2] * a.detection.bbox[3]
+    area_b = b.detection.bbox[2] * b.detection.bbox[3]
+    if overlap / (area_a + area_b - overlap) >= iou_threshold:
+        return True
+    if not (a.truncated or b.truncated):
+        return False
+    # A fragment cut by a seam is mostly contained in the neighbouring tile's
+    # view of the object, so compare against the smaller box instead of the union.
+    if overlap / min(area_a, area_b) >= iou_threshold:
+        return True
+    return a.truncated and b.truncated and _masks_touch(a.detection, b.detection, region)
+
+
+def _stitch(kept: _PlacedDetection, other: _PlacedDetection) -> _PlacedDetection:
+    """Fold ``other`` into ``kept`` by uniting their boxes and masks.
+
+    The boxes are always united. When either mask does not match its box the
+    masks cannot be combined and the merged detection carries an empty mask.
+    """
+
+    first = kept.detection
+    second = other.detection
+    assert first.bbox is not None and second.bbox is not None
+    left = min(first.bbox[0], second.bbox[0])
+    top = min(first.bbox[1], second.bbox[1])
+    right = max(first.bbox[0] + first.bbox[2], second.bbox[0] + second.bbox[2])
+    bottom = max(first.bbox[1] + first.bbox[3], second.bbox[1] + second.bbox[3])
+    width = right - left
+
+    mask = bytearray()
+    if _has_valid_mask(first) and _has_valid_mask(second):
+        mask = bytearray(width * (bottom - top))
+        for source in (first, second):
+            assert source.bbox is not None
+            box_x, box_y, box_width, box_height = source.bbox
+            for row in range(box_y, box_y + box_height):
+                start = (row - top) * width + (box_x - left)
+                painted = int.from_bytes(mask[start : start + box_width], "big")
+                painted |= _mask_row(source, row, box_x, box_width)
+                mask[start : start + box_width] = painted.to_bytes(box_width, "big")
+
+    crop = second.crop if kept.truncated and not other.truncated else first.crop
+    return _PlacedDetection(
+        detection=replace(
+            first, mask=bytes(mask), bbox=(left, top, width, bottom - top), crop=crop
+        ),
+        truncated=kept.truncated and other.truncated,
+    )
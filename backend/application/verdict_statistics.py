@@ -0,0 +1,353 @@
+"""Streaming aggregation of inspection verdicts into time-bucketed rollups."""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Protocol, Sequence, Tuple
+
+from backend.core.config import StatisticsConfig
+from backend.domain.entities import InspectionVerdict
+
+GRANULARITIES = ("minute", "hour", "shift")
+UNKNOWN = "unknown"
+_SNAPSHOT_VERSION = 1
+
+
+class StatisticsStore(Protocol):
+    """Protocol for persisting compacted statistics snapshots."""
+
+    def save(self, snapshot: Mapping[str, Any]) -> None:
+        """Persist the snapshot, replacing any previous one."""
+
+    def load(self) -> Optional[Mapping[str, Any]]:
+        """Return the last persisted snapshot, if any."""
+
+
+@dataclass(frozen=True)
+class BucketStatistics:
+    """NG counts for a single time bucket after filtering."""
+
+    start: datetime
+    inspected: int
+    ng: int
+    ng_by_label: Mapping[str, int]
+
+    @property
+    def ng_rate(self) -> float:
+        """Fraction of inspected items that were NG."""
+
+        return self.ng / self.inspected if self.inspected else 0.0
+
+
+@dataclass(frozen=True)
+class ControlChartPoint:
+    """A p-chart point with its bucket-specific control limits."""
+
+    start: datetime
+    inspected: int
+    ng: int
+    ng_rate: float
+    upper_limit: float
+    lower_limit: float
+
+    @property
+    def out_of_control(self) -> bool:
+        """Whether the NG rate falls outside the control limits."""
+
+        return not self.lower_limit <= self.ng_rate <= self.upper_limit
+
+
+@dataclass(frozen=True)
+class ControlChart:
+    """p-chart of NG rates over consecutive buckets."""
+
+    center_line: float
+    points: Tuple[ControlChartPoint, ...]
+
+
+def build_control_chart(buckets: Sequence[BucketStatistics]) -> ControlChart:
+    """Build a p-chart with three-sigma limits from queried buckets.
+
+    Buckets without inspections carry no information and are left out.
+    """
+
+    populated = [bucket for bucket in buckets if bucket.inspected]
+    inspected = sum(bucket.inspected for bucket in populated)
+    center = sum(bucket.ng for bucket in populated) / inspected if inspected else 0.0
+    points = []
+    for bucket in populated:
+        sigma = math.sqrt(center * (1.0 - center) / bucket.inspected)
+        points.append(
+            ControlChartPoint(
+                start=bucket.start,
+                inspected=bucket.inspected,
+                ng=bucket.ng,
+                ng_rate=bucket.ng_rate,
+                upper_limit=min(center + 3.0 * sigma, 1.0),
+                lower_limit=max(center - 3.0 * sigma, 0.0),
+            )
+        )
+    return ControlChart(center_line=center, points=tuple(points))
+
+
+def local_time(timestamp: datetime) -> datetime:
+    """Return ``timestamp`` as naive local time, the clock buckets are keyed by.
+
+    Shift boundaries are defined in plant-local hours, so timezone-aware
+    timestamps are converted to local time before their offset is dropped.
+    """
+
+    if timestamp.tzinfo is None:
+        return timestamp
+    return timestamp.astimezone().replace(tzinfo=None)
+
+
+@dataclass
+class _Bucket:
+    """Rolling counters for one bucket across cameras, sources, and labels."""
+
+    inspected: Counter = field(default_factory=Counter)  # camera -> count
+    ng: Counter = field(default_factory=Counter)  # (camera, source, label) -> count
+
+
+class VerdictStatistics:
+    """Maintains minute, hour, and shift rollups of the verdict stream.
+
+    Each recorded verdict increments one counter per granularity, so queries
+    only visit the buckets of the requested range instead of scanning verdict
+    history. Buckets older than their retention window are evicted during
+    compaction, which also persists the in-memory state to the configured store.
+    Periodic compaction runs on a background thread so recording never waits
+    for disk I/O. Timestamps are normalized with :func:`local_time`.
+    """
+
+    def __init__(
+        self,
+        config: Optional[StatisticsConfig] = None,
+        store: Optional[StatisticsStore] = None,
+    ) -> None:
+        self._config = config or StatisticsConfig()
+        self._store = store
+        self._retention = {
+            "minute": timedelta(hours=self._config.minute_retention_hours),
+            "hour": timedelta(days=self._config.hour_retention_days),
+            "shift": timedelta(days=self._config.shift_retention_days),
+        }
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Dict[datetime, _Bucket]] = {name: {} for name in GRANULARITIES}
+        self._latest: Optional[datetime] = None
+        self._last_compaction: Optional[datetime] = None
+        self._save_lock = threading.Lock()
+        self._compactor: Optional[threading.Thread] = None
+
+    def load(self) -> bool:
+        """Restore rollups from the store and return whether a snapshot existed.
+
+        Raises ``ValueError`` for snapshots written by an incompatible version;
+        the rollups are left empty when restoring fails.
+        """
+
+        snapshot = self._store.load() if self._store is not None else None
+        if snapshot is None:
+            return False
+        with self._lock:
+            try:
+                self._restore(snapshot)
+            except Exception:
+                self._buckets = {name: {} for name in GRANULARITIES}
+                self._latest = self._last_compaction = None
+                raise
+        return True
+
+    def record(self, verdict: InspectionVerdict, camera: str, timestamp: datetime) -> None:
+        """Add a verdict observed on ``camera`` at ``timestamp`` to every rollup."""
+
+        timestamp = local_time(timestamp)
+        with self._lock:
+            for granularity in GRANULARITIES:
+                start = self.bucket_start(granularity, timestamp)
+                bucket = self._buckets[granularity].setdefault(start, _Bucket())
+                bucket.inspected[camera] += 1
+                if verdict.status == "NG":
+                    bucket.ng[(camera, verdict.source or UNKNOWN, verdict.label or UNKNOWN)] += 1
+
+            if self._latest is None or timestamp > self._latest:
+                self._latest = timestamp
+            if self._last_compaction is None:
+                self._last_compaction = timestamp
+            due = (timestamp - self._last_compaction).total_seconds() >= self._config.compaction_interval
+            if due:
+                self._last_compaction = timestamp
+                compactor = threading.Thread(
+                    target=self.compact, name="statistics-compaction", daemon=True
+                )
+                self._compactor = compactor
+
+        if due:
+            compactor.start()
+
+    def compact(self) -> None:
+        """Evict expired buckets and persist the remaining state.
+
+        Saves are serialized so that snapshots reach the store in order.
+        """
+
+        with self._save_lock:
+            with self._lock:
+                if self._latest is not None:
+                    for granularity, buckets in self._buckets.items():
+                        horizon = self._latest - self._retention[granularity]
+                        for start in [start for start in buckets if start < horizon]:
+                            del buckets[start]
+                snapshot = self._snapshot() if self._store is not None else None
+
+            if self._store is not None and snapshot is not None:
+                self._store.save(snapshot)
+
+    def wait_for_compaction(self, timeout: Optional[float] = None) -> None:
+        """Block until the most recent background compaction has finished."""
+
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join(timeout)
+
+    def query(
+        self,
+        granularity: str,
+        start: datetime,
+        end: datetime,
+        camera: Optional[str] = None,
+        label: Optional[str] = None,
+        source: Optional[str] = None,
+    ) -> List[BucketStatistics]:
+        """Return per-bucket NG counts for buckets starting in ``[start, end)``.
+
+        The range is clipped to the retention window and walked one bucket at
+        a time, so the cost depends on the range rather than on how many
+        buckets are held. Buckets without inspections for the selected camera
+        are omitted.
+        """
+
+        buckets = self._buckets_for(granularity)
+        start, end = local_time(start), local_time(end)
+        results: List[BucketStatistics] = []
+        with self._lock:
+            if self._latest is None:
+                return results
+            start = max(start, self._latest - self._retention[granularity])
+            end = min(end, self._latest + timedelta(seconds=1))
+            if start >= end:
+                return results
+            bucket_start = self.bucket_start(granularity, start)
+            if bucket_start < start:
+                bucket_start = self._next_bucket_start(granularity, bucket_start)
+            for bucket_start in self._bucket_starts(granularity, bucket_start, end):
+                bucket = buckets.get(bucket_start)
+                if bucket is None:
+                    continue
+                inspected = (
+                    bucket.inspected[camera] if camera is not None else sum(bucket.inspected.values())
+                )
+                if not inspected:
+                    continue
+                by_label: Counter = Counter()
+                for (ng_camera, ng_source, ng_label), count in bucket.ng.items():
+                    if camera is not None and ng_camera != camera:
+                        continue
+                    if source is not None and ng_source != source:
+                        continue
+                    if label is not None and ng_label != label:
+                        continue
+                    by_label[ng_label] += count
+                results.append(
+                    BucketStatistics(
+                        start=bucket_start,
+                        inspected=inspected,
+                        ng=sum(by_label.values()),
+                        ng_by_label=dict(by_label),
+                    )
+                )
+        return results
+
+    def bucket_start(self, granularity: str, timestamp: datetime) -> datetime:
+        """Return the start of the bucket containing ``timestamp``."""
+
+        if granularity == "minute":
+            return timestamp.replace(second=0, microsecond=0)
+        if granularity == "hour":
+            return timestamp.replace(minute=0, second=0, microsecond=0)
+        if granularity == "shift":
+            day = timestamp.replace(minute=0, second=0, microsecond=0)
+            for hour in reversed(self._config.shift_start_hours):
+                if timestamp.hour >= hour:
+                    return day.replace(hour=hour)
+            return (day - timedelta(days=1)).replace(hour=self._config.shift_start_hours[-1])
+        raise ValueError(f"Unknown granularity: {granularity}")
+
+    def _next_bucket_start(self, granularity: str, bucket_start: datetime) -> datetime:
+        """Return the start of the bucket following the one at ``bucket_start``."""
+
+        if granularity == "minute":
+            return bucket_start + timedelta(minutes=1)
+        if granularity == "hour":
+            return bucket_start + timedelta(hours=1)
+        hours = self._config.shift_start_hours
+        later = [hour for hour in hours if hour > bucket_start.hour]
+        if later:
+            return bucket_start.replace(hour=later[0])
+        return (bucket_start + timedelta(days=1)).replace(hour=hours[0])
+
+    def _bucket_starts(self, granularity: str, first: datetime, end: datetime) -> Iterator[datetime]:
+        """Yield consecutive bucket starts from ``first`` up to ``end``."""
+
+        current = first
+        while current < end:
+            yield current
+            current = self._next_bucket_start(granularity, current)
+
+    def _buckets_for(self, granularity: str) -> Dict[datetime, _Bucket]:
+        """Return the rollup for ``granularity`` or raise for unknown names."""
+
+        try:
+            return self._buckets[granularity]
+        except KeyError:
+            raise ValueError(f"Unknown granularity: {granularity}") from None
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """Serialize the in-memory rollups to plain JSON-compatible data."""
+
+        return {
+            "version": _SNAPSHOT_VERSION,
+            "latest": self._latest.isoformat() if self._latest is not None else None,
+            "buckets": {
+                granularity: [
+                    {
+                        "start": start.isoformat(),
+                        "inspected": dict(bucket.inspected),
+                        "ng": [[*key, count] for key, count in bucket.ng.items()],
+                    }
+                    for start, bucket in sorted(buckets.items())
+                ]
+                for granularity, buckets in self._buckets.items()
+            },
+        }
+
+    def _restore(self, snapshot: Mapping[str, Any]) -> None:
+        """Load rollups from a snapshot produced by :meth:`_snapshot`."""
+
+        if snapshot.get("version") != _SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported statistics snapshot version: {snapshot.get('version')}")
+        latest = snapshot.get("latest")
+        self._latest = local_time(datetime.fromisoformat(latest)) if latest else None
+        self._last_compaction = self._latest
+        for granularity, entries in snapshot.get("buckets", {}).items():
+            buckets = self._buckets_for(granularity)
+            for entry in entries:
+                bucket = _Bucket(inspected=Counter(entry["inspected"]))
+                for camera, source, label, count in entry["ng"]:
+                    bucket.ng[(camera, source, label)] = count
+                buckets[local_time(datetime.fromisoformat(entry["start"]))] = bucket
@@ -4,16 +4,23 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
 @dataclass
 class RTSPSource:
-    """Represents a single RTSP camera stream."""
+    """Represents a single RTSP camera stream.
+
+    The optional frame geometry describes decoded frames and is required to
+    publish the stream to the operator console live view.
+    """
 
     name: str
     url: str
     enabled: bool = True
+    frame_width: Optional[int] = None
+    frame_height: Optional[int] = None
+    channels: int = 3
 
 
 @dataclass
@@ -28,6 +35,58 @@ class ModelConfig:
     iou_threshold: float = 0.5
 
 
+@dataclass
+class TilingConfig:
+    """Controls tiled inference for frames larger than the detector input.
+
+    Frames are split into ``tile_width`` x ``tile_height`` tiles that overlap by
+    ``overlap`` pixels, and at most ``batch_size`` tiles are held in memory and
+    sent to the detector per call.
+    """
+
+    tile_width: int = 640
+    tile_height: int = 640
+    overlap: int = 64
+    batch_size: int = 8
+
+    def __post_init__(self) -> None:
+        if self.tile_width <= 0 or self.tile_height <= 0:
+            raise ValueError("Tile dimensions must be positive")
+        if self.overlap < 0 or self.overlap >= min(self.tile_width, self.tile_height):
+            raise ValueError("Tile overlap must be non-negative and smaller than the tile size")
+        if self.batch_size <= 0:
+            raise ValueError("Tile batch size must be positive")
+
+
+@dataclass
+class StatisticsConfig:
+    """Controls the streaming NG statistics rollups.
+
+    Buckets are kept in memory for their retention window and the in-memory
+    state is compacted to ``snapshot_path`` every ``compaction_interval``
+    seconds of verdict time. ``shift_start_hours`` lists the local hours at
+    which production shifts begin. Without an explicit ``snapshot_path``,
+    :class:`Settings` stores the snapshot as ``statistics.json`` in its
+    ``data_dir``.
+    """
+
+    snapshot_path: Optional[Path] = None
+    compaction_interval: float = 300.0
+    shift_start_hours: Tuple[int, ...] = (6, 14, 22)
+    minute_retention_hours: int = 24
+    hour_retention_days: int = 90
+    shift_retention_days: int = 365
+
+    def __post_init__(self) -> None:
+        if self.snapshot_path is not None:
+            self.snapshot_path = Path(self.snapshot_path)
+        self.shift_start_hours = tuple(sorted(self.shift_start_hours))
+        if not self.shift_start_hours or not all(0 <= hour < 24 for hour in self.shift_start_hours):
+            raise ValueError("Shift start hours must be between 0 and 23")
+        if self.compaction_interval <= 0:
+            raise ValueError("Compaction interval must be positive")
+
+
 @dataclass
 class Settings:
     """Aggregated application settings.
@@ -42,6 +101,12 @@ class Settings:
     artifact_dir: Path = Path("artifacts")
     rtsp_sources: List[RTSPSource] = field(default_factory=list)
     model: Optional[ModelConfig] = None
+    tiling: Optional[TilingConfig] = None
+    statistics: StatisticsConfig = field(default_factory=StatisticsConfig)
+
+    def __post_init__(self) -> None:
+        if self.statistics.snapshot_path is None:
+            self.statistics.snapshot_path = Path(self.data_dir) / "statistics.json"
 
     @classmethod
     def from_dict(cls, values: dict[str, object]) -> "Settings":
@@ -50,10 +115,16 @@ class Settings:
         rtsp_entries = [RTSPSource(**entry) for entry in values.get("rtsp_sources", [])]
         model_entry = values.get("model")
         model = ModelConfig(**model_entry) if model_entry else None
+        tiling_entry = values.get("tiling")
+        tiling = TilingConfig(**tiling_entry) if tiling_entry else None
+        statistics_entry = values.get("statistics")
+        statistics = StatisticsConfig(**statistics_entry) if statistics_entry else StatisticsConfig()
         return cls(
             environment=values.get("environment", "development"),
             data_dir=Path(values.get("data_dir", "data")),
             artifact_dir=Path(values.get("artifact_dir", "artifacts")),
             rtsp_sources=rtsp_entries,
             model=model,
+            tiling=tiling,
+            statistics=statistics,
         )
@@ -3,17 +3,27 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
+
+BoundingBox = Tuple[int, int, int, int]
+"""Pixel-aligned box expressed as ``(x, y, width, height)``."""
 
 
 @dataclass(frozen=True)
 class DetectionResult:
-    """Represents a YOLO segmentation detection with an optional crop."""
+    """Represents a YOLO segmentation detection with an optional crop.
+
+    When ``bbox`` is populated, ``mask`` is interpreted as a row-major binary
+    mask covering the box with one byte per pixel (non-zero marks foreground).
+    The box is what allows detections produced on frame tiles to be placed back
+    onto the full frame and merged across tile seams.
+    """
 
     label: str
     confidence: float
     mask: bytes
     crop: Optional[bytes] = None
+    bbox: Optional[BoundingBox] = None
 
 
 @dataclass(frozen=True)
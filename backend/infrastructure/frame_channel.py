@@ -0,0 +1,340 @@
+"""Shared-memory channel publishing the latest frame and verdict per camera."""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import math
+import secrets
+import struct
+import sys
+import time
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from backend.core.config import RTSPSource
+from backend.domain.entities import DetectionResult, InspectionVerdict
+from backend.interfaces.inspection import InspectionVerdictDTO
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "rqi_frames_"
+
+# sequence, generation, timestamp, width, height, channels, frame length, metadata length
+_HEADER = struct.Struct("<QQdIIIII")
+_SEQUENCE = struct.Struct("<Q")
+_FIELDS = struct.Struct("<QdIIIII")
+_DEFAULT_PUBLISH_RATE = 60.0
+_MIN_METADATA_CAPACITY = 64 * 1024
+_MAX_READ_ATTEMPTS = 8
+_IS_WINDOWS = sys.platform == "win32"
+
+
+def channel_name(camera: str) -> str:
+    """Return the shared-memory block name used for a camera."""
+
+    return f"{CHANNEL_PREFIX}{camera}"
+
+
+@dataclass(frozen=True)
+class SharedFrame:
+    """Snapshot of the most recent frame published for a camera."""
+
+    sequence: int
+    generation: int
+    timestamp: float
+    width: int
+    height: int
+    channels: int
+    pixels: bytes
+    verdict: InspectionVerdict
+    detections: Tuple[DetectionResult, ...] = ()
+
+
+class SharedFrameWriter:
+    """Publishes frames into a single-slot shared-memory block.
+
+    The slot always holds the latest frame only; readers that fall behind skip
+    intermediate frames instead of queueing them. A sequence counter that is odd
+    while a write is in progress lets readers detect and retry torn reads.
+
+    Every writer stamps a random generation into the header. When a restarted
+    backend finds the block of a previous writer still present, it reuses it
+    under a new generation so that attached readers notice the reset sequence.
+    Metadata capacity defaults to half the frame capacity. Masks are only
+    published for NG verdicts, the only ones the live view draws, and
+    detections that do not fit are published without masks rather than
+    failing the publish.
+    """
+
+    def __init__(
+        self, camera: str, frame_capacity: int, metadata_capacity: Optional[int] = None
+    ) -> None:
+        self._frame_capacity = frame_capacity
+        self._metadata_capacity = (
+            metadata_capacity
+            if metadata_capacity is not None
+            else max(_MIN_METADATA_CAPACITY, frame_capacity // 2)
+        )
+        self._memory = _open_writable(
+            channel_name(camera), _HEADER.size + frame_capacity + self._metadata_capacity
+        )
+        self.generation = secrets.randbits(63) + 1
+        self._sequence = 0
+        _HEADER.pack_into(self._memory.buf, 0, 0, self.generation, 0.0, 0, 0, 0, 0, 0)
+
+    def publish(
+        self,
+        frame: bytes,
+        width: int,
+        height: int,
+        channels: int,
+        verdict: InspectionVerdict,
+        detections: Sequence[DetectionResult] = (),
+        timestamp: Optional[float] = None,
+    ) -> int:
+        """Write a frame with its verdict and return the published sequence number."""
+
+        if len(frame) > self._frame_capacity:
+            raise ValueError(f"Frame of {len(frame)} bytes exceeds channel capacity {self._frame_capacity}")
+        include_masks = verdict.status == "NG" and (
+            sum(_encoded_mask_size(detection) for detection in detections) < self._metadata_capacity
+        )
+        metadata = _encode_metadata(verdict, detections, include_masks)
+        if len(metadata) > self._metadata_capacity and include_masks:
+            metadata = _encode_metadata(verdict, detections, include_masks=False)
+        if len(metadata) > self._metadata_capacity:
+            metadata = _encode_metadata(verdict, (), include_masks=False)
+        if len(metadata) > self._metadata_capacity:
+            raise ValueError(
+                f"Metadata of {len(metadata)} bytes exceeds channel capacity {self._metadata_capacity}"
+            )
+
+        # Everything, header fields included, is written while the sequence is
+        # odd; the even sequence is stored last so readers never pair it with
+        # stale lengths.
+        buffer = self._memory.buf
+        _SEQUENCE.pack_into(buffer, 0, self._sequence + 1)
+        frame_start = _HEADER.size
+        metadata_start = frame_start + len(frame)
+        buffer[frame_start:metadata_start] = frame
+        buffer[metadata_start : metadata_start + len(metadata)] = metadata
+        _FIELDS.pack_into(
+            buffer,
+            _SEQUENCE.size,
+            self.generation,
+            time.time() if timestamp is None else timestamp,
+            width,
+            height,
+            channels,
+            len(frame),
+            len(metadata),
+        )
+        self._sequence += 2
+        _SEQUENCE.pack_into(buffer, 0, self._sequence)
+        return self._sequence // 2
+
+    def close(self) -> None:
+        """Release and remove the shared-memory block."""
+
+        self._memory.close()
+        try:
+            self._memory.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class SharedFrameReader:
+    """Reads the latest frame published by a :class:`SharedFrameWriter`."""
+
+    def __init__(self, camera: str) -> None:
+        self._memory = shared_memory.SharedMemory(name=channel_name(camera))
+        # Python < 3.13 tracks attached blocks too and would unlink the writer's
+        # block when the reading process exits.
+        if not _IS_WINDOWS:
+            resource_tracker.unregister(self._memory._name, "shared_memory")
+
+    def read(self, after_sequence: int = 0, generation: int = 0) -> Optional[SharedFrame]:
+        """Return the latest frame if it is newer than ``after_sequence``.
+
+        ``after_sequence`` only applies while the writer ``generation`` is
+        unchanged; a frame from a different generation is always returned.
+        Pixels are copied out of shared memory exactly once. ``None`` is returned
+        when no newer frame is available or a consistent snapshot could not be
+        taken because the writer kept overwriting the slot.
+        """
+
+        buffer = self._memory.buf
+        for _ in range(_MAX_READ_ATTEMPTS):
+            (
+                sequence,
+                header_generation,
+                timestamp,
+                width,
+                height,
+                channels,
+                frame_length,
+                metadata_length,
+            ) = _HEADER.unpack_from(buffer, 0)
+            if sequence % 2:
+                continue
+            if sequence == 0:
+                return None
+            if header_generation == generation and sequence // 2 <= after_sequence:
+                return None
+
+            frame_start = _HEADER.size
+            metadata_start = frame_start + frame_length
+            pixels = bytes(buffer[frame_start:metadata_start])
+            metadata = bytes(buffer[metadata_start : metadata_start + metadata_length])
+            if _SEQUENCE.unpack_from(buffer, 0)[0] != sequence:
+                continue
+
+            verdict, detections = _decode_metadata(metadata)
+            return SharedFrame(
+                sequence=sequence // 2,
+                generation=header_generation,
+                timestamp=timestamp,
+                width=width,
+                height=height,
+                channels=channels,
+                pixels=pixels,
+                verdict=verdict,
+                detections=detections,
+            )
+        return None
+
+    def close(self) -> None:
+        """Detach from the shared-memory block without removing it."""
+
+        self._memory.close()
+
+
+class SharedFramePublisher:
+    """Publishes inspected frames of configured cameras to their frame channels.
+
+    Channels are created for enabled sources with a known frame geometry.
+    Frames of other cameras, or frames that do not match the configured
+    geometry, are skipped so that the live view never interrupts inspection.
+    Publishing is limited to ``max_rate`` frames per second and camera, the
+    display rate readers poll at, so faster inspection does not spend time
+    copying frames no viewer will ever see.
+    """
+
+    def __init__(
+        self,
+        sources: Sequence[RTSPSource],
+        max_rate: float = _DEFAULT_PUBLISH_RATE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_rate <= 0:
+            raise ValueError("Publish rate must be positive")
+        self._interval = 1.0 / max_rate
+        self._clock = clock
+        self._last_published: Dict[str, float] = {}
+        self._channels: Dict[str, Tuple[SharedFrameWriter, int, int, int]] = {}
+        for source in sources:
+            if not (source.enabled and source.frame_width and source.frame_height):
+                continue
+            size = source.frame_width * source.frame_height * source.channels
+            self._channels[source.name] = (
+                SharedFrameWriter(source.name, frame_capacity=size),
+                source.frame_width,
+                source.frame_height,
+                source.channels,
+            )
+
+    def publish(
+        self,
+        camera: str,
+        frame: bytes,
+        verdict: InspectionVerdict,
+        detections: Sequence[DetectionResult],
+    ) -> None:
+        """Publish ``frame`` with its verdict if ``camera`` has a channel."""
+
+        channel = self._channels.get(camera)
+        if channel is None:
+            return
+        now = self._clock()
+        last = self._last_published.get(camera)
+        if last is not None and now - last < self._interval:
+            return
+        writer, width, height, channels = channel
+        if len(frame) != width * height * channels:
+            logger.warning(
+                "Skipping live view frame for %s: %d bytes does not match %dx%dx%d",
+                camera,
+                len(frame),
+                width,
+                height,
+                channels,
+            )
+            return
+        writer.publish(frame, width, height, channels, verdict, detections)
+        self._last_published[camera] = now
+
+    def close(self) -> None:
+        """Remove every channel created by the publisher."""
+
+        for writer, *_ in self._channels.values():
+            writer.close()
+        self._channels.clear()
+
+
+def _open_writable(name: str, size: int) -> shared_memory.SharedMemory:
+    """Create a channel block, reusing one left behind by a previous writer."""
+
+    try:
+        return shared_memory.SharedMemory(name=name, create=True, size=size)
+    except FileExistsError:
+        existing = shared_memory.SharedMemory(name=name)
+        if existing.size >= size:
+            return existing
+        existing.close()
+        existing.unlink()
+        return shared_memory.SharedMemory(name=name, create=True, size=size)
+
+
+def _encoded_mask_size(detection: DetectionResult) -> int:
+    """Return the length of a detection mask once base64 encoded."""
+
+    return 4 * math.ceil(len(detection.mask) / 3)
+
+
+def _encode_metadata(
+    verdict: InspectionVerdict, detections: Sequence[DetectionResult], include_masks: bool
+) -> bytes:
+    """Serialize the verdict and detection overlays to JSON."""
+
+    payload = {
+        "verdict": InspectionVerdictDTO.from_domain(verdict).model_dump(),
+        "detections": [
+            {
+                "label": detection.label,
+                "confidence": detection.confidence,
+                "bbox": list(detection.bbox) if detection.bbox is not None else None,
+                "mask": base64.b64encode(detection.mask).decode("ascii") if include_masks else "",
+            }
+            for detection in detections
+        ],
+    }
+    return json.dumps(payload).encode("utf-8")
+
+
+def _decode_metadata(metadata: bytes) -> Tuple[InspectionVerdict, Tuple[DetectionResult, ...]]:
+    """Rebuild the verdict and detections from their JSON representation."""
+
+    payload = json.loads(metadata)
+    detections = tuple(
+        DetectionResult(
+            label=entry["label"],
+            confidence=entry["confidence"],
+            mask=base64.b64decode(entry["mask"]),
+            bbox=tuple(entry["bbox"]) if entry["bbox"] is not None else None,
+        )
+        for entry in payload["detections"]
+    )
+    return InspectionVerdict(**payload["verdict"]), detections
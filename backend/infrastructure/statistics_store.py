@@ -0,0 +1,44 @@
+"""File-based persistence for compacted verdict statistics."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Mapping, Optional
+
+
+class JsonStatisticsStore:
+    """Stores the statistics snapshot as a JSON document on disk.
+
+    Snapshots are written to a temporary file first and atomically moved into
+    place, so a crash during compaction never leaves a truncated snapshot.
+    Each save uses its own temporary file, so concurrent saves cannot
+    interleave their writes.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = Path(path)
+
+    def save(self, snapshot: Mapping[str, Any]) -> None:
+        """Persist the snapshot, replacing any previous one."""
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(
+            dir=self._path.parent, prefix=self._path.name + ".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+                json.dump(snapshot, handle)
+            os.replace(temporary, self._path)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+
+    def load(self) -> Optional[Mapping[str, Any]]:
+        """Return the last persisted snapshot, if any."""
+
+        if not self._path.exists():
+            return None
+        return json.loads(self._path.read_text(encoding="utf-8"))
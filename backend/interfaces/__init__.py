@@ -1,5 +1,6 @@
 """Interface layer exports for API schemas."""
 
 from backend.interfaces.inspection import InspectionVerdictDTO
+from backend.interfaces.statistics import StatisticsBucketDTO, StatisticsDTO
 
-__all__ = ["InspectionVerdictDTO"]
+__all__ = ["InspectionVerdictDTO", "StatisticsBucketDTO", "StatisticsDTO"]
@@ -0,0 +1,60 @@
+"""Interface schemas for NG statistics and control chart responses."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+from backend.application.verdict_statistics import BucketStatistics, ControlChart
+
+
+@dataclass(frozen=True)
+class StatisticsBucketDTO:
+    """Data transfer object for one statistics bucket and its p-chart limits."""
+
+    start: str
+    inspected: int
+    ng: int
+    ng_rate: float
+    ng_by_label: Dict[str, int]
+    upper_limit: Optional[float] = None
+    lower_limit: Optional[float] = None
+    out_of_control: Optional[bool] = None
+
+
+@dataclass(frozen=True)
+class StatisticsDTO:
+    """Data transfer object representing NG statistics over a time range."""
+
+    granularity: str
+    center_line: float
+    buckets: List[StatisticsBucketDTO]
+
+    @classmethod
+    def from_domain(
+        cls, granularity: str, buckets: List[BucketStatistics], chart: ControlChart
+    ) -> "StatisticsDTO":
+        """Build a DTO combining bucket counts with control chart limits."""
+
+        limits = {point.start: point for point in chart.points}
+        entries = []
+        for bucket in buckets:
+            point = limits.get(bucket.start)
+            entries.append(
+                StatisticsBucketDTO(
+                    start=bucket.start.isoformat(),
+                    inspected=bucket.inspected,
+                    ng=bucket.ng,
+                    ng_rate=bucket.ng_rate,
+                    ng_by_label=dict(bucket.ng_by_label),
+                    upper_limit=point.upper_limit if point is not None else None,
+                    lower_limit=point.lower_limit if point is not None else None,
+                    out_of_control=point.out_of_control if point is not None else None,
+                )
+            )
+        return cls(granularity=granularity, center_line=chart.center_line, buckets=entries)
+
+    def model_dump(self) -> Dict[str, Any]:
+        """Serialize the DTO to a plain dictionary for API responses."""
+
+        return asdict(self)
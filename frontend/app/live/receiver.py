@@ -0,0 +1,168 @@
+"""Background frame receiver feeding the live view at the display refresh rate."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Protocol, Sequence, Tuple
+
+from backend.infrastructure.frame_channel import SharedFrame, SharedFrameReader
+from frontend.app.live.state import LatestFrameMailbox
+
+logger = logging.getLogger(__name__)
+
+
+class FrameSource(Protocol):
+    """Protocol for transports delivering the latest frame per camera."""
+
+    def read(self, camera: str, after_sequence: int, generation: int) -> Optional[SharedFrame]:
+        """Return the newest frame for ``camera`` unless it was already seen.
+
+        ``after_sequence`` only applies to frames of the same writer
+        ``generation``; frames from a restarted writer are always returned.
+        """
+
+    def reset(self, camera: str) -> None:
+        """Drop any state held for ``camera`` so the next read starts afresh."""
+
+
+class SharedMemoryFrameSource:
+    """Frame source reading the backend's shared-memory frame channels.
+
+    Channels are attached lazily so the console can start before the backend
+    begins publishing a camera. A channel that delivers nothing for
+    ``stale_after`` seconds is re-attached by name, which picks up the new
+    block of a restarted backend instead of the orphaned one.
+    """
+
+    def __init__(self, stale_after: float = 2.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self._stale_after = stale_after
+        self._clock = clock
+        self._readers: Dict[str, SharedFrameReader] = {}
+        self._last_activity: Dict[str, float] = {}
+
+    def read(self, camera: str, after_sequence: int, generation: int) -> Optional[SharedFrame]:
+        """Return the newest frame for ``camera`` unless it was already seen."""
+
+        now = self._clock()
+        reader = self._readers.get(camera)
+        if reader is None:
+            try:
+                reader = SharedFrameReader(camera)
+            except FileNotFoundError:
+                return None
+            self._readers[camera] = reader
+            self._last_activity[camera] = now
+
+        frame = reader.read(after_sequence, generation)
+        if frame is not None:
+            self._last_activity[camera] = now
+        elif now - self._last_activity[camera] >= self._stale_after:
+            self.reset(camera)
+        return frame
+
+    def reset(self, camera: str) -> None:
+        """Detach from ``camera`` so the next read attaches to its channel again."""
+
+        reader = self._readers.pop(camera, None)
+        if reader is not None:
+            reader.close()
+
+    def close(self) -> None:
+        """Detach from every attached channel."""
+
+        for reader in self._readers.values():
+            reader.close()
+        self._readers.clear()
+
+
+class FrameReceiver:
+    """Polls a frame source on a worker thread and hands frames to the GUI.
+
+    Polling is paced at ``refresh_rate`` so frames published faster than the
+    display can show them are skipped at the source instead of being copied,
+    decoded, and discarded on the GUI thread. Skipped frames are counted per
+    camera for diagnostics. ``prepare`` runs on the worker thread and may
+    convert a frame into a display-ready object, such as an image already
+    scaled to its tile; returning ``None`` drops the frame. A camera whose
+    read or preparation fails is logged and reset at the source, and polling
+    continues with the other cameras.
+    """
+
+    def __init__(
+        self,
+        source: FrameSource,
+        cameras: Sequence[str],
+        mailbox: LatestFrameMailbox,
+        refresh_rate: float = 60.0,
+        prepare: Optional[Callable[[str, SharedFrame], Any]] = None,
+    ) -> None:
+        if refresh_rate <= 0:
+            raise ValueError("Refresh rate must be positive")
+        self._source = source
+        self._cameras = tuple(cameras)
+        self._mailbox = mailbox
+        self._interval = 1.0 / refresh_rate
+        self._prepare = prepare
+        self._cursors: Dict[str, Tuple[int, int]] = {camera: (0, 0) for camera in self._cameras}
+        self._skipped: Dict[str, int] = {camera: 0 for camera in self._cameras}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def skipped(self, camera: str) -> int:
+        """Return how many published frames were never displayed for ``camera``."""
+
+        return self._skipped.get(camera, 0)
+
+    def poll_once(self) -> int:
+        """Fetch the newest frame of every camera and return how many arrived."""
+
+        received = 0
+        for camera in self._cameras:
+            try:
+                received += self._poll_camera(camera)
+            except Exception:
+                logger.exception("Failed to receive a frame for %s", camera)
+                self._source.reset(camera)
+        return received
+
+    def _poll_camera(self, camera: str) -> int:
+        """Fetch and hand over the newest frame of ``camera``, returning 1 if one arrived."""
+
+        generation, previous = self._cursors[camera]
+        frame = self._source.read(camera, previous, generation)
+        if frame is None:
+            return 0
+        if frame.generation == generation and previous:
+            self._skipped[camera] += max(frame.sequence - previous - 1, 0)
+        self._cursors[camera] = (frame.generation, frame.sequence)
+        prepared = self._prepare(camera, frame) if self._prepare is not None else frame
+        if prepared is None:
+            return 0
+        self._mailbox.put(camera, prepared)
+        return 1
+
+    def start(self) -> None:
+        """Start polling on a daemon thread."""
+
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="frame-receiver", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling and wait for the worker thread to exit."""
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        """Worker loop polling the source once per display refresh."""
+
+        while not self._stop.is_set():
+            self.poll_once()
+            self._stop.wait(self._interval)
@@ -0,0 +1,89 @@
+"""Qt-independent state shared between the live view receiver and widgets."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Tuple
+
+from backend.domain.entities import DetectionResult
+from backend.infrastructure.frame_channel import SharedFrame
+
+
+class LatestFrameMailbox:
+    """Thread-safe, latest-wins hand-off of frames from the receiver to the GUI.
+
+    Only the newest frame per camera is retained, so a slow GUI thread never
+    accumulates a backlog of stale frames. Entries are whatever the receiver
+    prepared for display, typically a frame already scaled to its tile.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._frames: Dict[str, Any] = {}
+
+    def put(self, camera: str, frame: Any) -> None:
+        """Store ``frame`` as the newest frame for ``camera``."""
+
+        with self._lock:
+            self._frames[camera] = frame
+
+    def take_all(self) -> Dict[str, Any]:
+        """Return and clear the pending frames for every camera."""
+
+        with self._lock:
+            frames, self._frames = self._frames, {}
+        return frames
+
+
+class RateMeter:
+    """Rolling frame rate and latency estimate over a sliding time window."""
+
+    def __init__(self, window: float = 2.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self._window = window
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._samples: Deque[Tuple[float, float]] = deque()
+
+    def record(self, latency: float = 0.0) -> None:
+        """Register one frame together with its end-to-end latency in seconds."""
+
+        now = self._clock()
+        with self._lock:
+            self._samples.append((now, latency))
+            self._expire(now)
+
+    def snapshot(self) -> Tuple[float, float]:
+        """Return the frame rate in Hz and the mean latency in milliseconds."""
+
+        now = self._clock()
+        with self._lock:
+            self._expire(now)
+            if not self._samples:
+                return 0.0, 0.0
+            count = len(self._samples)
+            latency = sum(sample[1] for sample in self._samples) / count
+        return count / self._window, latency * 1000.0
+
+    def _expire(self, now: float) -> None:
+        """Drop samples that fell out of the window."""
+
+        while self._samples and now - self._samples[0][0] > self._window:
+            self._samples.popleft()
+
+
+def overlay_detections(frame: SharedFrame) -> Tuple[DetectionResult, ...]:
+    """Select the detections whose masks should be rendered for a frame.
+
+    Overlays are only drawn for ``NG`` frames. Detections matching the verdict
+    label are preferred; when the verdict came from the classifier and no
+    detection carries its label, every detection of the frame is highlighted.
+    """
+
+    if frame.verdict.status != "NG":
+        return ()
+    matching = tuple(
+        detection for detection in frame.detections if detection.label == frame.verdict.label
+    )
+    return matching or frame.detections
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import argparse
 import sys
 
 from PyQt6.QtWidgets import QApplication
@@ -12,8 +13,17 @@ from frontend.app.windows.main_window import MainWindow
 def main() -> None:
     """Launch the PyQt application."""
 
-    app = QApplication(sys.argv)
-    window = MainWindow()
+    parser = argparse.ArgumentParser(description="Realtime quality inspection console")
+    parser.add_argument(
+        "--camera",
+        action="append",
+        default=[],
+        help="Camera name published by the backend; repeat for several cameras.",
+    )
+    args, qt_args = parser.parse_known_args()
+
+    app = QApplication([sys.argv[0], *qt_args])
+    window = MainWindow(cameras=args.camera)
     window.show()
     sys.exit(app.exec())
 
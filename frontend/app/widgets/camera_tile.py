@@ -0,0 +1,173 @@
+"""Widget rendering a single camera stream with verdict overlays."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from PyQt6.QtCore import QPointF, QRectF, Qt
+from PyQt6.QtGui import QColor, QImage, QPainter, QPaintEvent, QPen, QResizeEvent
+from PyQt6.QtWidgets import QWidget
+
+from backend.domain.entities import DetectionResult
+from backend.infrastructure.frame_channel import SharedFrame
+from frontend.app.live.state import RateMeter, overlay_detections
+
+_FORMATS = {
+    1: QImage.Format.Format_Grayscale8,
+    3: QImage.Format.Format_RGB888,
+    4: QImage.Format.Format_RGBA8888,
+}
+_BINARY = bytes([0] + [1] * 255)
+_MASK_COLORS = [QColor(0, 0, 0, 0).rgba(), QColor(255, 48, 48, 128).rgba()]
+_NG_COLOR = QColor(220, 40, 40)
+_OK_COLOR = QColor(40, 180, 80)
+
+
+@dataclass(frozen=True)
+class _Overlay:
+    """Mask image and box of an NG detection in scaled image coordinates."""
+
+    rect: QRectF
+    mask: Optional[QImage]
+    data: bytes
+
+
+@dataclass(frozen=True)
+class RenderedFrame:
+    """Frame already scaled to its tile, ready to be painted as-is."""
+
+    frame: SharedFrame
+    image: QImage
+    overlays: Tuple[_Overlay, ...]
+
+
+class CameraTile(QWidget):
+    """Paints the latest frame of a camera together with NG overlays and stats.
+
+    :meth:`prepare` runs on the receiver thread and scales each frame and its
+    NG masks to the current tile size, so the GUI thread only blits images
+    that are already display-sized, however large the camera resolution.
+    """
+
+    def __init__(self, camera: str, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._camera = camera
+        self._rendered: Optional[RenderedFrame] = None
+        self._meter = RateMeter()
+        self._skipped = 0
+        self._target_size = (160, 120)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.setMinimumSize(*self._target_size)
+
+    def prepare(self, frame: SharedFrame) -> Optional[RenderedFrame]:
+        """Scale ``frame`` and its overlays to the tile; safe off the GUI thread."""
+
+        image_format = _FORMATS.get(frame.channels)
+        if image_format is None or not frame.width or not frame.height:
+            return None
+
+        width, height = self._target_size
+        source = QImage(
+            frame.pixels, frame.width, frame.height, frame.width * frame.channels, image_format
+        )
+        image = source.scaled(
+            width,
+            height,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.FastTransformation,
+        )
+        scale = image.width() / frame.width
+        overlays = tuple(
+            self._build_overlay(detection, scale)
+            for detection in overlay_detections(frame)
+            if detection.bbox is not None
+        )
+        # The frame keeps the pixel buffer alive in case scaling shared it.
+        return RenderedFrame(frame=frame, image=image, overlays=overlays)
+
+    def show_frame(self, rendered: RenderedFrame, skipped: int = 0) -> None:
+        """Display a prepared frame on the next paint."""
+
+        self._rendered = rendered
+        self._skipped = skipped
+        self._meter.record(max(time.time() - rendered.frame.timestamp, 0.0))
+        self.update()
+
+    def resizeEvent(self, event: QResizeEvent) -> None:  # noqa: N802 - Qt naming
+        """Remember the size frames should be scaled to by the receiver."""
+
+        self._target_size = (max(event.size().width(), 1), max(event.size().height(), 1))
+        super().resizeEvent(event)
+
+    def paintEvent(self, event: QPaintEvent) -> None:  # noqa: N802 - Qt naming
+        """Draw the frame, overlays, and diagnostics."""
+
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), Qt.GlobalColor.black)
+        rendered = self._rendered
+        if rendered is not None:
+            origin = QPointF(
+                (self.width() - rendered.image.width()) / 2,
+                (self.height() - rendered.image.height()) / 2,
+            )
+            painter.drawImage(origin, rendered.image)
+            self._draw_overlays(painter, origin, rendered)
+            border = _NG_COLOR if rendered.frame.verdict.status == "NG" else _OK_COLOR
+            painter.setPen(QPen(border, 3))
+            painter.drawRect(self.rect().adjusted(1, 1, -2, -2))
+        self._draw_status(painter)
+        painter.end()
+
+    @staticmethod
+    def _build_overlay(detection: DetectionResult, scale: float) -> _Overlay:
+        """Prepare the mask image for a detection scaled onto the tile image."""
+
+        assert detection.bbox is not None
+        x, y, width, height = detection.bbox
+        rect = QRectF(x * scale, y * scale, width * scale, height * scale)
+        if len(detection.mask) != width * height:
+            return _Overlay(rect=rect, mask=None, data=b"")
+
+        data = detection.mask.translate(_BINARY)
+        mask = QImage(data, width, height, width, QImage.Format.Format_Indexed8)
+        mask.setColorTable(_MASK_COLORS)
+        scaled = mask.scaled(
+            max(round(rect.width()), 1),
+            max(round(rect.height()), 1),
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.FastTransformation,
+        )
+        return _Overlay(rect=rect, mask=scaled, data=data)
+
+    @staticmethod
+    def _draw_overlays(painter: QPainter, origin: QPointF, rendered: RenderedFrame) -> None:
+        """Paint pre-scaled NG masks and boxes on top of the frame."""
+
+        if not rendered.overlays:
+            return
+        painter.save()
+        painter.translate(origin)
+        painter.setPen(QPen(_NG_COLOR, 2))
+        for overlay in rendered.overlays:
+            if overlay.mask is not None:
+                painter.drawImage(overlay.rect.topLeft(), overlay.mask)
+            painter.drawRect(overlay.rect)
+        painter.restore()
+
+    def _draw_status(self, painter: QPainter) -> None:
+        """Paint the camera name, verdict, and FPS/latency diagnostics."""
+
+        fps, latency_ms = self._meter.snapshot()
+        status = self._rendered.frame.verdict.status if self._rendered is not None else "waiting"
+        text = (
+            f"{self._camera}  {status}  {fps:.1f} fps  "
+            f"{latency_ms:.0f} ms  skipped {self._skipped}"
+        )
+        painter.setPen(Qt.GlobalColor.white)
+        painter.drawText(
+            QRectF(self.rect()).adjusted(8, 6, -8, -6),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop,
+            text,
+        )
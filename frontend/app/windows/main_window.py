@@ -2,12 +2,93 @@
 
 from __future__ import annotations
 
-from PyQt6.QtWidgets import QMainWindow
+import math
+from typing import Dict, Optional, Sequence
+
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QCloseEvent, QGuiApplication
+from PyQt6.QtWidgets import QGridLayout, QMainWindow, QWidget
+
+from backend.infrastructure.frame_channel import SharedFrame
+from frontend.app.live.receiver import FrameReceiver, FrameSource, SharedMemoryFrameSource
+from frontend.app.live.state import LatestFrameMailbox
+from frontend.app.widgets.camera_tile import CameraTile, RenderedFrame
+
+_DEFAULT_REFRESH_RATE = 60.0
 
 
 class MainWindow(QMainWindow):
-    """Placeholder main window to be wired with Qt Designer UI."""
+    """Operator console showing a live grid of camera tiles.
+
+    Frames are received and scaled to their tiles on a background thread and
+    collected in a latest-wins mailbox; a timer running at the display refresh
+    rate hands only the newest frame of each camera to its tile, keeping the
+    GUI thread free of polling, pixel copies, and scaling regardless of the
+    number or resolution of cameras.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cameras: Sequence[str] = (),
+        source: Optional[FrameSource] = None,
+        columns: Optional[int] = None,
+    ) -> None:
         super().__init__()
         self.setWindowTitle("Realtime Quality Inspection")
+
+        self._tiles: Dict[str, CameraTile] = {}
+        central = QWidget(self)
+        grid = QGridLayout(central)
+        grid.setSpacing(2)
+        columns = columns or max(1, math.ceil(math.sqrt(len(cameras))))
+        for index, camera in enumerate(cameras):
+            tile = CameraTile(camera, central)
+            grid.addWidget(tile, index // columns, index % columns)
+            self._tiles[camera] = tile
+        self.setCentralWidget(central)
+
+        self._owned_source = SharedMemoryFrameSource() if source is None else None
+        refresh_rate = self._refresh_rate()
+        self._mailbox = LatestFrameMailbox()
+        self._receiver = FrameReceiver(
+            source or self._owned_source,
+            cameras,
+            self._mailbox,
+            refresh_rate,
+            prepare=self._prepare,
+        )
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._render_pending)
+        self._timer.start(max(int(1000 / refresh_rate), 1))
+        if cameras:
+            self._receiver.start()
+
+    def closeEvent(self, event: QCloseEvent) -> None:  # noqa: N802 - Qt naming
+        """Stop background polling before the window closes."""
+
+        self._timer.stop()
+        self._receiver.stop()
+        if self._owned_source is not None:
+            self._owned_source.close()
+        super().closeEvent(event)
+
+    def _prepare(self, camera: str, frame: SharedFrame) -> Optional[RenderedFrame]:
+        """Scale a received frame for its tile on the receiver thread."""
+
+        tile = self._tiles.get(camera)
+        return tile.prepare(frame) if tile is not None else None
+
+    def _render_pending(self) -> None:
+        """Forward the newest received frame of each camera to its tile."""
+
+        for camera, rendered in self._mailbox.take_all().items():
+            self._tiles[camera].show_frame(rendered, self._receiver.skipped(camera))
+
+    @staticmethod
+    def _refresh_rate() -> float:
+        """Return the primary screen refresh rate, falling back to 60 Hz."""
+
+        screen = QGuiApplication.primaryScreen()
+        rate = screen.refreshRate() if screen is not None else 0.0
+        return rate if rate > 0 else _DEFAULT_REFRESH_RATE
@@ -0,0 +1,534 @@
+"""Shared data loading subsystem for detector and classifier training.
+
+Images are decoded and resized once into a cache of fixed-size records split
+across memory-mapped shard files. Later epochs gather records from the shards on
+prefetch threads instead of decoding images again, and a checkpointed cursor
+allows an interrupted run to resume mid-epoch.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import mmap
+import multiprocessing
+import os
+import random
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+ImageSize = Tuple[int, int, int]
+"""Decoded sample geometry expressed as ``(width, height, channels)``."""
+
+Decoder = Callable[[Path, ImageSize], bytes]
+"""Callable decoding an image file into resized, row-major raw pixels."""
+
+IMAGE_SUFFIXES = frozenset({".bmp", ".jpeg", ".jpg", ".png", ".tif", ".tiff"})
+
+_INDEX_FILE = "index.json"
+_SHARD_MAPPINGS: Dict[str, mmap.mmap] = {}
+
+
+@dataclass(frozen=True)
+class Sample:
+    """Training sample pointing to an image file and its JSON-serializable target."""
+
+    path: Path
+    target: Any
+
+
+@dataclass(frozen=True)
+class Batch:
+    """Contiguous block of decoded samples ready to be wrapped by a training framework."""
+
+    pixels: bytes
+    targets: Tuple[Any, ...]
+    image_size: ImageSize
+
+    @property
+    def size(self) -> int:
+        """Number of samples in the batch."""
+
+        return len(self.targets)
+
+
+@dataclass(frozen=True)
+class LoaderCursor:
+    """Position of the loader within a training run."""
+
+    epoch: int = 0
+    batch: int = 0
+
+    def save(self, path: Path) -> None:
+        """Atomically persist the cursor as JSON."""
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(path.suffix + ".tmp")
+        temporary.write_text(json.dumps(asdict(self)), encoding="utf-8")
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "LoaderCursor":
+        """Load a cursor previously written by :meth:`save`."""
+
+        return cls(**json.loads(path.read_text(encoding="utf-8")))
+
+
+@dataclass(frozen=True)
+class EpochStats:
+    """Throughput measurements for a single epoch."""
+
+    epoch: int
+    samples: int
+    seconds: float
+    cache_built: bool = False
+
+    @property
+    def samples_per_second(self) -> float:
+        """Samples delivered per wall-clock second."""
+
+        return self.samples / self.seconds if self.seconds > 0 else 0.0
+
+
+@dataclass
+class DataLoaderConfig:
+    """Tuning parameters for :class:`ShardedDataLoader`.
+
+    ``workers`` sets the processes decoding images into the cache and the
+    threads prefetching batches from it; ``0`` does both in the calling thread.
+    """
+
+    image_size: ImageSize = (224, 224, 3)
+    batch_size: int = 32
+    workers: int = 2
+    prefetch: int = 4
+    shard_size: int = 1024
+    shuffle: bool = True
+    seed: int = 0
+    checkpoint_every: int = 50
+
+    def __post_init__(self) -> None:
+        self.image_size = tuple(self.image_size)  # type: ignore[assignment]
+        if len(self.image_size) != 3 or min(self.image_size) <= 0:
+            raise ValueError("Image size must be a positive (width, height, channels) triple")
+        if self.batch_size <= 0 or self.shard_size <= 0 or self.prefetch <= 0:
+            raise ValueError("Batch size, shard size, and prefetch depth must be positive")
+        if self.workers < 0:
+            raise ValueError("Worker count must not be negative")
+
+    @classmethod
+    def from_model_config(cls, model: Mapping[str, Any]) -> "DataLoaderConfig":
+        """Build loader settings from a ``models.<name>`` entry of a project manifest."""
+
+        options = dict(model.get("data", {}))
+        batch_size = model.get("hyperparameters", {}).get("batch_size")
+        if batch_size is not None:
+            options.setdefault("batch_size", batch_size)
+        return cls(**options)
+
+
+def pil_decoder(path: Path, image_size: ImageSize) -> bytes:
+    """Decode and resize an image with Pillow."""
+
+    try:
+        from PIL import Image
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise ImportError("Pillow is required to decode training images: pip install pillow") from exc
+
+    width, height, channels = image_size
+    mode = {1: "L", 3: "RGB", 4: "RGBA"}[channels]
+    with Image.open(path) as image:
+        return image.convert(mode).resize((width, height)).tobytes()
+
+
+class ShardCache:
+    """Cache of decoded samples stored as fixed-size records in shard files.
+
+    Every record holds exactly ``width * height * channels`` bytes, so a sample
+    is located by its index alone. Shards are written to temporary files and
+    moved into place once complete, which lets an interrupted build resume
+    from the first missing shard. The cache is invalidated when the sample
+    list, the image files, or the geometry change.
+    """
+
+    def __init__(
+        self, root: Path, samples: Sequence[Sample], image_size: ImageSize, shard_size: int
+    ) -> None:
+        self.root = Path(root)
+        self.samples = list(samples)
+        self.image_size = image_size
+        self.shard_size = shard_size
+        self.record_size = image_size[0] * image_size[1] * image_size[2]
+        self._fingerprint: Optional[str] = None
+
+    @property
+    def fingerprint(self) -> str:
+        """Digest identifying the samples and geometry stored in the cache."""
+
+        if self._fingerprint is None:
+            digest = hashlib.sha1()
+            digest.update(json.dumps([list(self.image_size), self.shard_size]).encode("utf-8"))
+            for sample in self.samples:
+                stat = sample.path.stat()
+                entry = [str(sample.path), stat.st_size, stat.st_mtime_ns, sample.target]
+                digest.update(json.dumps(entry).encode("utf-8"))
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    @property
+    def shard_count(self) -> int:
+        """Number of shard files needed for all samples."""
+
+        return math.ceil(len(self.samples) / self.shard_size)
+
+    @property
+    def shard_paths(self) -> List[str]:
+        """Paths of the shard files in index order."""
+
+        return [str(self.root / f"shard-{shard:05d}.bin") for shard in range(self.shard_count)]
+
+    def is_complete(self) -> bool:
+        """Whether the cache holds every sample for the current fingerprint."""
+
+        index = self._read_index()
+        return (
+            index is not None
+            and index.get("complete") is True
+            and index.get("fingerprint") == self.fingerprint
+        )
+
+    def build(self, decode: Decoder, workers: int = 0) -> None:
+        """Decode every missing shard, using ``workers`` processes when positive."""
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        _release_shards(self.shard_paths)
+        index = self._read_index()
+        if index is None or index.get("fingerprint") != self.fingerprint:
+            for stale in self.root.glob("shard-*"):
+                stale.unlink()
+        self._write_index(complete=False)
+
+        decode_sample = partial(_decode_sample, decode, self.image_size, self.record_size)
+        pool = multiprocessing.Pool(workers) if workers > 0 else None
+        try:
+            for shard, path in enumerate(map(Path, self.shard_paths)):
+                chunk = self.samples[shard * self.shard_size : (shard + 1) * self.shard_size]
+                if path.exists() and path.stat().st_size == len(chunk) * self.record_size:
+                    continue
+                paths = [sample.path for sample in chunk]
+                records = pool.imap(decode_sample, paths, chunksize=8) if pool else map(decode_sample, paths)
+                temporary = path.with_suffix(".tmp")
+                with temporary.open("wb") as handle:
+                    for record in records:
+                        handle.write(record)
+                os.replace(temporary, path)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        self._write_index(complete=True)
+
+    def _read_index(self) -> Optional[Dict[str, Any]]:
+        """Return the cache index, treating a missing or unreadable one as absent."""
+
+        path = self.root / _INDEX_FILE
+        try:
+            index = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return index if isinstance(index, dict) else None
+
+    def _write_index(self, complete: bool) -> None:
+        """Persist the cache index describing the stored shards."""
+
+        index = {
+            "fingerprint": self.fingerprint,
+            "image_size": list(self.image_size),
+            "shard_size": self.shard_size,
+            "samples": len(self.samples),
+            "complete": complete,
+        }
+        path = self.root / _INDEX_FILE
+        temporary = path.with_suffix(path.suffix + ".tmp")
+        temporary.write_text(json.dumps(index), encoding="utf-8")
+        os.replace(temporary, path)
+
+
+class ShardedDataLoader:
+    """Epoch-based loader reading batches from a :class:`ShardCache`.
+
+    The cache is built on the first epoch that needs it. Batch order is derived
+    from ``seed`` and the epoch number only, so a run resumed from a
+    :class:`LoaderCursor` replays exactly the remaining batches of the epoch.
+
+    Batches are gathered by threads sharing the shard mappings rather than by
+    processes: assembling a batch is a memory copy that runs without the GIL,
+    whereas sending it back from a process would pickle and pipe every byte.
+    """
+
+    def __init__(
+        self,
+        samples: Sequence[Sample],
+        cache_dir: Path,
+        config: Optional[DataLoaderConfig] = None,
+        decode: Decoder = pil_decoder,
+    ) -> None:
+        self.config = config or DataLoaderConfig()
+        self.cache = ShardCache(cache_dir, samples, self.config.image_size, self.config.shard_size)
+        self._decode = decode
+
+    def __len__(self) -> int:
+        """Number of batches per epoch."""
+
+        return math.ceil(len(self.cache.samples) / self.config.batch_size)
+
+    def ensure_cache(self) -> bool:
+        """Build the shard cache if needed and report whether it was built."""
+
+        if self.cache.is_complete():
+            return False
+        started = time.perf_counter()
+        self.cache.build(self._decode, self.config.workers)
+        logger.info(
+            "Cached %d samples into %d shards in %.2fs",
+            len(self.cache.samples),
+            self.cache.shard_count,
+            time.perf_counter() - started,
+        )
+        return True
+
+    def epoch(self, epoch: int, start_batch: int = 0) -> Iterator[Batch]:
+        """Yield the batches of ``epoch`` starting at ``start_batch``."""
+
+        self.ensure_cache()
+        order = list(range(len(self.cache.samples)))
+        if self.config.shuffle:
+            random.Random(self.config.seed + epoch).shuffle(order)
+        size = self.config.batch_size
+        batches = [order[start : start + size] for start in range(start_batch * size, len(order), size)]
+        read = partial(_read_records, self.cache.shard_paths, self.cache.shard_size, self.cache.record_size)
+
+        if self.config.workers == 0:
+            for indices in batches:
+                yield self._batch(read(indices), indices)
+            return
+
+        for path in self.cache.shard_paths:
+            _open_shard(path)
+        executor = ThreadPoolExecutor(self._reader_threads(), thread_name_prefix="shard-reader")
+        pending: Deque[Tuple[List[int], Future]] = deque()
+        try:
+            upcoming = iter(batches)
+            for indices in islice(upcoming, self.config.prefetch):
+                pending.append((indices, executor.submit(read, indices)))
+            while pending:
+                indices, result = pending.popleft()
+                following = next(upcoming, None)
+                if following is not None:
+                    pending.append((following, executor.submit(read, following)))
+                yield self._batch(result.result(), indices)
+        finally:
+            for _, result in pending:
+                result.cancel()
+            executor.shutdown(wait=True)
+
+    def run(
+        self,
+        epochs: int,
+        train_step: Callable[[Batch], None],
+        cursor_path: Optional[Path] = None,
+        resume: bool = False,
+        on_checkpoint: Optional[Callable[[LoaderCursor], None]] = None,
+    ) -> List[EpochStats]:
+        """Feed ``epochs`` epochs to ``train_step`` and return per-epoch throughput.
+
+        When ``cursor_path`` is given the cursor is saved every
+        ``checkpoint_every`` batches and at the end of each epoch, and
+        ``on_checkpoint`` is invoked so the caller can persist model state at
+        the same position. With ``resume`` the run continues from that cursor.
+        """
+
+        cursor = LoaderCursor()
+        if resume and cursor_path is not None and cursor_path.exists():
+            cursor = LoaderCursor.load(cursor_path)
+            logger.info("Resuming at epoch %d, batch %d", cursor.epoch, cursor.batch)
+
+        stats: List[EpochStats] = []
+        for epoch in range(cursor.epoch, epochs):
+            start_batch = cursor.batch if epoch == cursor.epoch else 0
+            started = time.perf_counter()
+            cache_built = self.ensure_cache()
+            samples = 0
+            for number, batch in enumerate(self.epoch(epoch, start_batch), start=start_batch + 1):
+                train_step(batch)
+                samples += batch.size
+                if number % self.config.checkpoint_every == 0 and number < len(self):
+                    self._checkpoint(LoaderCursor(epoch, number), cursor_path, on_checkpoint)
+            self._checkpoint(LoaderCursor(epoch + 1, 0), cursor_path, on_checkpoint)
+
+            epoch_stats = EpochStats(
+                epoch=epoch,
+                samples=samples,
+                seconds=time.perf_counter() - started,
+                cache_built=cache_built,
+            )
+            logger.info(
+                "Epoch %d: %d samples in %.2fs (%.1f samples/s%s)",
+                epoch,
+                epoch_stats.samples,
+                epoch_stats.seconds,
+                epoch_stats.samples_per_second,
+                ", including cache build" if cache_built else "",
+            )
+            stats.append(epoch_stats)
+        return stats
+
+    def _reader_threads(self) -> int:
+        """Number of prefetch threads, capped so concurrent copies never oversubscribe the CPUs."""
+
+        return max(1, min(self.config.workers, self.config.prefetch, os.cpu_count() or 1))
+
+    def _batch(self, pixels: bytes, indices: Sequence[int]) -> Batch:
+        """Attach targets to a block of decoded pixels."""
+
+        return Batch(
+            pixels=pixels,
+            targets=tuple(self.cache.samples[index].target for index in indices),
+            image_size=self.config.image_size,
+        )
+
+    @staticmethod
+    def _checkpoint(
+        cursor: LoaderCursor,
+        cursor_path: Optional[Path],
+        on_checkpoint: Optional[Callable[[LoaderCursor], None]],
+    ) -> None:
+        """Persist the cursor and notify the caller."""
+
+        if cursor_path is not None:
+            cursor.save(cursor_path)
+        if on_checkpoint is not None:
+            on_checkpoint(cursor)
+
+
+def load_pipeline_config(config_path: Path) -> Dict[str, Any]:
+    """Load a project training manifest from YAML."""
+
+    with Path(config_path).open(encoding="utf-8") as handle:
+        return yaml.safe_load(handle)
+
+
+def run_training(
+    config: Mapping[str, Any],
+    model_name: str,
+    samples: Sequence[Sample],
+    train_step: Optional[Callable[[Batch], None]] = None,
+    resume: bool = False,
+    on_checkpoint: Optional[Callable[[LoaderCursor], None]] = None,
+    decode: Decoder = pil_decoder,
+) -> List[EpochStats]:
+    """Train ``models.<model_name>`` of a project manifest on ``samples``.
+
+    The loader cache lives under ``paths.cache_root/<model_name>`` and the
+    cursor and metrics under ``paths.artifacts_root``. ``on_checkpoint`` is
+    called whenever the cursor is saved and must persist the model state, so
+    that ``resume`` continues training from weights matching the cursor.
+    Without a ``train_step`` only the data pipeline is exercised, which
+    measures loader throughput on CPU-only machines.
+    """
+
+    model = config["models"][model_name]
+    paths = config["paths"]
+    artifacts_root = Path(paths["artifacts_root"])
+    cache_root = Path(paths.get("cache_root", artifacts_root / "cache"))
+    if not samples:
+        raise ValueError(f"No {model_name} samples found under {paths['dataset_root']}")
+
+    loader = ShardedDataLoader(
+        samples, cache_root / model_name, DataLoaderConfig.from_model_config(model), decode
+    )
+    if train_step is None:
+        logger.warning("No %s training step configured; measuring data loading only", model_name)
+    elif on_checkpoint is None:
+        logger.warning("No %s checkpoint hook configured; resumed runs restart from stale weights", model_name)
+
+    stats = loader.run(
+        epochs=model.get("hyperparameters", {}).get("epochs", 1),
+        train_step=train_step or (lambda batch: None),
+        cursor_path=artifacts_root / model_name / "loader_cursor.json",
+        resume=resume,
+        on_checkpoint=on_checkpoint,
+    )
+    write_epoch_metrics(artifacts_root, model_name, stats)
+    return stats
+
+
+def write_epoch_metrics(artifacts_root: Path, model: str, stats: Sequence[EpochStats]) -> Path:
+    """Write per-epoch throughput to ``experiments/<timestamp>/metrics.json``."""
+
+    directory = Path(artifacts_root) / "experiments" / datetime.now().strftime("%Y%m%d-%H%M%S")
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / "metrics.json"
+    payload = {
+        "model": model,
+        "epochs": [
+            {**asdict(entry), "samples_per_second": entry.samples_per_second} for entry in stats
+        ],
+    }
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    return path
+
+
+def _decode_sample(decode: Decoder, image_size: ImageSize, record_size: int, path: Path) -> bytes:
+    """Decode a single sample and validate its record size."""
+
+    record = decode(path, image_size)
+    if len(record) != record_size:
+        raise ValueError(f"Decoder returned {len(record)} bytes for {path}, expected {record_size}")
+    return record
+
+
+def _open_shard(path: str) -> mmap.mmap:
+    """Memory-map a shard once per process and share it between threads."""
+
+    shard = _SHARD_MAPPINGS.get(path)
+    if shard is None:
+        with open(path, "rb") as handle:
+            shard = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        _SHARD_MAPPINGS[path] = shard
+    return shard
+
+
+def _release_shards(paths: Sequence[str]) -> None:
+    """Close mappings of shards that are about to be rewritten."""
+
+    for path in paths:
+        shard = _SHARD_MAPPINGS.pop(path, None)
+        if shard is not None:
+            shard.close()
+
+
+def _read_records(
+    shard_paths: Sequence[str], shard_size: int, record_size: int, indices: Sequence[int]
+) -> bytes:
+    """Gather the records for ``indices`` into one contiguous buffer."""
+
+    parts = []
+    for index in indices:
+        shard, offset = divmod(index, shard_size)
+        view = memoryview(_open_shard(shard_paths[shard]))
+        parts.append(view[offset * record_size : (offset + 1) * record_size])
+    return b"".join(parts)
@@ -2,14 +2,69 @@
 
 from __future__ import annotations
 
+import argparse
+import logging
 from pathlib import Path
+from typing import Callable, List, Optional, Sequence
 
+from models.pipelines.data_loading import (
+    IMAGE_SUFFIXES,
+    Batch,
+    EpochStats,
+    LoaderCursor,
+    Sample,
+    load_pipeline_config,
+    run_training,
+)
 
-def train_classifier(config_path: Path) -> None:
-    """Placeholder function for classifier training pipeline."""
 
-    raise NotImplementedError("Implement MobileNet training pipeline")
+def discover_samples(dataset_root: Path, labels: Sequence[str]) -> List[Sample]:
+    """Collect ``<dataset_root>/classification/<label>/*`` images as labelled samples.
+
+    Targets are indices into ``labels`` so they stay stable across runs.
+    """
+
+    samples = []
+    for index, label in enumerate(labels):
+        directory = dataset_root / "classification" / label
+        if not directory.is_dir():
+            continue
+        samples.extend(
+            Sample(path=path, target=index)
+            for path in sorted(directory.iterdir())
+            if path.suffix.lower() in IMAGE_SUFFIXES
+        )
+    return samples
+
+
+def train_classifier(
+    config_path: Path,
+    train_step: Optional[Callable[[Batch], None]] = None,
+    resume: bool = False,
+    on_checkpoint: Optional[Callable[[LoaderCursor], None]] = None,
+) -> List[EpochStats]:
+    """Run the classifier training loop over the shared sharded data loader.
+
+    See :func:`run_training` for the ``train_step``, ``resume``, and
+    ``on_checkpoint`` hooks.
+    """
+
+    config = load_pipeline_config(config_path)
+    samples = discover_samples(Path(config["paths"]["dataset_root"]), config["labels"])
+    return run_training(config, "classifier", samples, train_step, resume, on_checkpoint)
+
+
+def main() -> None:
+    """Command line entry point."""
+
+    parser = argparse.ArgumentParser(description="Train a MobileNet classifier")
+    parser.add_argument("--config", type=Path, required=True, help="Project YAML manifest")
+    parser.add_argument("--resume", action="store_true", help="Continue from the saved loader cursor")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    train_classifier(args.config, resume=args.resume)
 
 
 if __name__ == "__main__":
-    raise SystemExit("Use `python -m models.pipelines.train_classifier --config <path>` once implemented")
+    main()
@@ -2,14 +2,71 @@
 
 from __future__ import annotations
 
+import argparse
+import logging
 from pathlib import Path
+from typing import Callable, List, Optional
 
+from models.pipelines.data_loading import (
+    IMAGE_SUFFIXES,
+    Batch,
+    EpochStats,
+    LoaderCursor,
+    Sample,
+    load_pipeline_config,
+    run_training,
+)
 
-def train_detector(config_path: Path) -> None:
-    """Placeholder function for detector training pipeline."""
 
-    raise NotImplementedError("Implement YOLO segmentation training pipeline")
+def discover_samples(dataset_root: Path) -> List[Sample]:
+    """Collect YOLO-format samples from ``images/`` and ``labels/`` directories.
+
+    Targets are the annotation lines of ``labels/<stem>.txt``. YOLO coordinates
+    are normalized, so they remain valid after the images are resized.
+    """
+
+    images = dataset_root / "images"
+    labels = dataset_root / "labels"
+    if not images.is_dir():
+        return []
+    samples = []
+    for path in sorted(images.iterdir()):
+        if path.suffix.lower() not in IMAGE_SUFFIXES:
+            continue
+        annotation = labels / f"{path.stem}.txt"
+        lines = annotation.read_text(encoding="utf-8").splitlines() if annotation.exists() else []
+        samples.append(Sample(path=path, target=[line for line in lines if line.strip()]))
+    return samples
+
+
+def train_detector(
+    config_path: Path,
+    train_step: Optional[Callable[[Batch], None]] = None,
+    resume: bool = False,
+    on_checkpoint: Optional[Callable[[LoaderCursor], None]] = None,
+) -> List[EpochStats]:
+    """Run the detector training loop over the shared sharded data loader.
+
+    See :func:`run_training` for the ``train_step``, ``resume``, and
+    ``on_checkpoint`` hooks.
+    """
+
+    config = load_pipeline_config(config_path)
+    samples = discover_samples(Path(config["paths"]["dataset_root"]))
+    return run_training(config, "detector", samples, train_step, resume, on_checkpoint)
+
+
+def main() -> None:
+    """Command line entry point."""
+
+    parser = argparse.ArgumentParser(description="Train a YOLO segmentation detector")
+    parser.add_argument("--config", type=Path, required=True, help="Project YAML manifest")
+    parser.add_argument("--resume", action="store_true", help="Continue from the saved loader cursor")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    train_detector(args.config, resume=args.resume)
 
 
 if __name__ == "__main__":
-    raise SystemExit("Use `python -m models.pipelines.train_detector --config <path>` once implemented")
+    main()
@@ -0,0 +1,85 @@
+"""Tests for the backend composition root."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+from backend.app.container import Container
+from backend.application.tiled_detection import TiledDetector
+from backend.core.config import RTSPSource, Settings, StatisticsConfig, TilingConfig
+from backend.domain.entities import DetectionResult
+from backend.domain.services import ThresholdBusinessRulesEngine
+
+
+class _StubDetector:
+    def detect(self, frame: bytes):
+        return [DetectionResult(label="scratch", confidence=0.9, mask=b"")]
+
+
+class _StubClassifier:
+    def classify(self, crops):
+        return []
+
+
+def _settings(tmp_path: Path) -> Settings:
+    """Build settings persisting statistics below ``tmp_path``."""
+
+    return Settings(statistics=StatisticsConfig(snapshot_path=tmp_path / "statistics.json"))
+
+
+def test_container_records_inspections_into_configured_statistics(tmp_path: Path) -> None:
+    """Services built by the container feed the statistics persisted on stop."""
+
+    container = Container(settings=_settings(tmp_path))
+    container.start()
+    service = container.inspection_service(
+        _StubDetector(),
+        _StubClassifier(),
+        ThresholdBusinessRulesEngine(ng_labels=frozenset({"scratch"}), ok_labels=frozenset()),
+    )
+
+    service.run(b"frame", camera="cam1")
+    container.stop()
+
+    buckets = container.statistics.query("hour", datetime.min, datetime.max, camera="cam1")
+    assert [(bucket.inspected, bucket.ng) for bucket in buckets] == [(1, 1)]
+    assert (tmp_path / "statistics.json").exists()
+
+
+def test_container_starts_empty_when_snapshot_is_unreadable(tmp_path: Path) -> None:
+    """A corrupt or incompatible snapshot must not prevent startup."""
+
+    for content in ("{not json", '{"version": 0}'):
+        (tmp_path / "statistics.json").write_text(content, encoding="utf-8")
+        container = Container(settings=_settings(tmp_path))
+
+        container.start()
+        container.stop()
+
+        assert container.statistics.query("hour", datetime.min, datetime.max) == []
+
+
+class _StubBatchDetector(_StubDetector):
+    def detect_batch(self, tiles):
+        return [[] for _ in tiles]
+
+
+def test_container_wraps_detector_for_tiled_cameras(tmp_path: Path) -> None:
+    """Cameras with a frame geometry get a tiled detector when tiling is configured."""
+
+    settings = _settings(tmp_path)
+    settings.tiling = TilingConfig(tile_width=40, tile_height=40, overlap=10)
+    settings.rtsp_sources = [
+        RTSPSource(name="cam1", url="rtsp://cam1", frame_width=70, frame_height=40, channels=1)
+    ]
+    container = Container(settings=settings)
+    engine = ThresholdBusinessRulesEngine(ng_labels=frozenset({"scratch"}), ok_labels=frozenset())
+
+    tiled = container.inspection_service(_StubBatchDetector(), _StubClassifier(), engine, camera="cam1")
+    untiled = container.inspection_service(_StubBatchDetector(), _StubClassifier(), engine, camera="cam2")
+
+    assert isinstance(tiled.detector, TiledDetector)
+    assert (tiled.detector.frame_width, tiled.detector.frame_height) == (70, 40)
+    assert isinstance(untiled.detector, _StubBatchDetector)
+    assert tiled.run(bytes(70 * 40), camera="cam1").status == "OK"
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Iterable, List, Optional
 
 import pytest
 
 from backend.application.inspection_service import InspectionService
+from backend.application.verdict_statistics import VerdictStatistics
 from backend.domain.entities import ClassificationResult, DetectionResult
 from backend.domain.services import ThresholdBusinessRulesEngine
 
@@ -96,3 +98,43 @@ def test_inspection_service_flags_ng_from_detection(engine: ThresholdBusinessRul
     assert verdict.label == "defect_a"
     assert verdict.confidence == pytest.approx(0.8)
     assert verdict.source == "detection"
+
+
+def test_inspection_service_records_verdicts_per_camera(engine: ThresholdBusinessRulesEngine) -> None:
+    """Verdicts should be forwarded to the configured recorder with their camera."""
+
+    detections = [DetectionResult(label="defect_a", confidence=0.8, mask=b"mask", crop=None)]
+    recorder = VerdictStatistics()
+    service = InspectionService(
+        detector=StubDetector(detections=detections),
+        classifier=StubClassifier(results=[]),
+        rules_engine=engine,
+        recorder=recorder,
+    )
+
+    service.run(b"frame-bytes", camera="cam1")
+
+    buckets = recorder.query("hour", datetime.min, datetime.max, camera="cam1")
+    assert [(bucket.inspected, bucket.ng) for bucket in buckets] == [(1, 1)]
+
+
+def test_inspection_service_publishes_inspected_frames(engine: ThresholdBusinessRulesEngine) -> None:
+    """Frames should reach the live view publisher together with their verdict."""
+
+    detections = [DetectionResult(label="defect_a", confidence=0.8, mask=b"mask", crop=None)]
+    published = []
+
+    class RecordingPublisher:
+        def publish(self, camera, frame, verdict, detections) -> None:
+            published.append((camera, frame, verdict.status, list(detections)))
+
+    service = InspectionService(
+        detector=StubDetector(detections=detections),
+        classifier=StubClassifier(results=[]),
+        rules_engine=engine,
+        publisher=RecordingPublisher(),
+    )
+
+    service.run(b"frame-bytes", camera="cam1")
+
+    assert published == [("cam1", b"frame-bytes", "NG", detections)]
@@ -0,0 +1,248 @@
+"""Tests for tiled inference over high-resolution frames."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, List, Sequence
+
+import pytest
+
+from backend.application.tiled_detection import TiledDetector, plan_tiles
+from backend.core.config import Settings, TilingConfig
+from backend.domain.entities import DetectionResult
+
+
+@dataclass
+class StubBatchDetector:
+    """Batch detector stub delegating per-tile detections to a callback."""
+
+    per_tile: Callable[[int], List[DetectionResult]]
+    batch_sizes: List[int] = field(default_factory=list)
+    tiles: List[bytes] = field(default_factory=list)
+
+    def detect_batch(self, tiles: Sequence[bytes]) -> Sequence[Iterable[DetectionResult]]:
+        self.batch_sizes.append(len(tiles))
+        results = []
+        for tile in tiles:
+            self.tiles.append(tile)
+            results.append(self.per_tile(len(self.tiles) - 1))
+        return results
+
+
+def _frame(width: int, height: int) -> bytes:
+    """Build a single-channel frame where each pixel stores its column index."""
+
+    return bytes(x % 256 for _ in range(height) for x in range(width))
+
+
+def test_plan_tiles_covers_frame_with_equal_sized_tiles() -> None:
+    """Tiles should overlap, share a shape, and end on the frame border."""
+
+    tiles = plan_tiles(100, 50, TilingConfig(tile_width=40, tile_height=50, overlap=10))
+
+    assert [tile.x for tile in tiles] == [0, 30, 60]
+    assert {(tile.width, tile.height, tile.y) for tile in tiles} == {(40, 50, 0)}
+
+
+def test_tiled_detector_batches_tiles_and_extracts_pixels() -> None:
+    """Tiles are sent in bounded batches and contain the matching frame pixels."""
+
+    detector = StubBatchDetector(per_tile=lambda index: [])
+    tiled = TiledDetector(
+        detector=detector,
+        frame_width=100,
+        frame_height=60,
+        channels=1,
+        tiling=TilingConfig(tile_width=40, tile_height=40, overlap=10, batch_size=4),
+    )
+
+    assert tiled.detect(_frame(100, 60)) == []
+    assert detector.batch_sizes == [4, 2]
+    assert detector.tiles[1] == bytes(range(30, 70)) * 40
+
+
+def test_tiled_detector_suppresses_duplicates_in_overlap() -> None:
+    """The same object seen by neighbouring tiles should be reported once."""
+
+    mask = b"\x01" * 16
+
+    def per_tile(index: int) -> List[DetectionResult]:
+        if index == 0:
+            return [DetectionResult(label="scratch", confidence=0.7, mask=mask, bbox=(32, 10, 4, 4))]
+        return [DetectionResult(label="scratch", confidence=0.9, mask=mask, bbox=(2, 10, 4, 4))]
+
+    tiled = TiledDetector(
+        detector=StubBatchDetector(per_tile=per_tile),
+        frame_width=70,
+        frame_height=40,
+        channels=1,
+        tiling=TilingConfig(tile_width=40, tile_height=40, overlap=10),
+    )
+
+    detections = tiled.detect(_frame(70, 40))
+
+    assert len(detections) == 1
+    assert detections[0].confidence == pytest.approx(0.9)
+    assert detections[0].bbox == (32, 10, 4, 4)
+
+
+def test_tiled_detector_stitches_masks_across_seams() -> None:
+    """An object cut by a tile seam should be merged into one full mask."""
+
+    def per_tile(index: int) -> List[DetectionResult]:
+        if index == 0:
+            # Columns 20..39 of the frame, truncated at the right tile border.
+            return [DetectionResult(label="crack", confidence=0.8, mask=b"\x01" * 40, bbox=(20, 5, 20, 2))]
+        # Columns 30..49 of the frame, truncated at the left tile border.
+        return [DetectionResult(label="crack", confidence=0.6, mask=b"\xff" * 40, bbox=(0, 5, 20, 2))]
+
+    tiled = TiledDetector(
+        detector=StubBatchDetector(per_tile=per_tile),
+        frame_width=70,
+        frame_height=40,
+        channels=1,
+        tiling=TilingConfig(tile_width=40, tile_height=40, overlap=10),
+        iou_threshold=0.5,
+    )
+
+    detections = tiled.detect(_frame(70, 40))
+
+    assert len(detections) == 1
+    assert detections[0].bbox == (20, 5, 30, 2)
+    assert detections[0].confidence == pytest.approx(0.8)
+    assert detections[0].mask == b"\x01" * 60
+
+
+def test_tiled_detector_unites_boxes_across_seams_without_masks() -> None:
+    """Box-only detections cut by a seam should still cover the whole object."""
+
+    def per_tile(index: int) -> List[DetectionResult]:
+        if index == 0:
+            # Frame columns 20..39, truncated at the right tile border.
+            return [DetectionResult(label="crack", confidence=0.8, mask=b"", bbox=(20, 5, 20, 10))]
+        # Frame columns 30..49, truncated at the left tile border.
+        return [DetectionResult(label="crack", confidence=0.6, mask=b"\x01" * 200, bbox=(0, 5, 20, 10))]
+
+    tiled = TiledDetector(
+        detector=StubBatchDetector(per_tile=per_tile),
+        frame_width=70,
+        frame_height=40,
+        channels=1,
+        tiling=TilingConfig(tile_width=40, tile_height=40, overlap=10),
+    )
+
+    detections = tiled.detect(_frame(70, 40))
+
+    assert len(detections) == 1
+    assert detections[0].bbox == (20, 5, 30, 10)
+    assert detections[0].mask == b""
+
+
+def test_tiled_detector_merges_seam_fragment_into_whole_detection() -> None:
+    """A fragment cut by one tile should fold into the neighbour's complete view."""
+
+    def per_tile(index: int) -> List[DetectionResult]:
+        if index == 0:
+            # Frame columns 36..39, truncated at the right tile border.
+            return [
+                DetectionResult(
+                    label="crack", confidence=0.9, mask=b"\x01" * 16, crop=b"fragment", bbox=(36, 0, 4, 4)
+                )
+            ]
+        # Frame columns 36..45, fully inside the second tile.
+        return [
+            DetectionResult(
+                label="crack", confidence=0.8, mask=b"\x01" * 40, crop=b"whole", bbox=(6, 0, 10, 4)
+            )
+        ]
+
+    tiled = TiledDetector(
+        detector=StubBatchDetector(per_tile=per_tile),
+        frame_width=70,
+        frame_height=40,
+        channels=1,
+        tiling=TilingConfig(tile_width=40, tile_height=40, overlap=10),
+    )
+
+    detections = tiled.detect(_frame(70, 40))
+
+    assert len(detections) == 1
+    assert detections[0].bbox == (36, 0, 10, 4)
+    assert detections[0].confidence == pytest.approx(0.9)
+    assert detections[0].mask == b"\x01" * 40
+    assert detections[0].crop == b"whole"
+
+
+def test_tiled_detector_keeps_distinct_labels_and_unplaced_detections() -> None:
+    """Different labels are never merged and box-less detections pass through."""
+
+    def per_tile(index: int) -> List[DetectionResult]:
+        if index == 0:
+            return [
+                DetectionResult(label="scratch", confidence=0.9, mask=b"\x01", bbox=(5, 5, 1, 1)),
+                DetectionResult(label="dent", confidence=0.8, mask=b"\x01", bbox=(5, 5, 1, 1)),
+                DetectionResult(label="stain", confidence=0.7, mask=b"mask"),
+            ]
+        return []
+
+    tiled = TiledDetector(
+        detector=StubBatchDetector(per_tile=per_tile),
+        frame_width=70,
+        frame_height=40,
+        channels=1,
+        tiling=TilingConfig(tile_width=40, tile_height=40, overlap=10),
+    )
+
+    labels = [detection.label for detection in tiled.detect(_frame(70, 40))]
+
+    assert labels == ["scratch", "dent", "stain"]
+
+
+def test_tiled_detector_rejects_frames_with_unexpected_size() -> None:
+    """Frames must match the configured geometry."""
+
+    tiled = TiledDetector(
+        detector=StubBatchDetector(per_tile=lambda index: []),
+        frame_width=10,
+        frame_height=10,
+    )
+
+    with pytest.raises(ValueError):
+        tiled.detect(b"\x00" * 10)
+
+
+def test_tiled_detector_from_config_uses_model_iou_threshold() -> None:
+    """Settings should coerce tiling options and the model IoU threshold is reused."""
+
+    settings = Settings.from_dict(
+        {
+            "model": {
+                "project": "sample_project",
+                "detector_path": "detector.pt",
+                "classifier_path": "classifier.pt",
+                "label_map": "labels.yaml",
+                "iou_threshold": 0.3,
+            },
+            "tiling": {"tile_width": 320, "tile_height": 320, "overlap": 32, "batch_size": 2},
+        }
+    )
+    assert settings.model is not None and settings.tiling is not None
+
+    tiled = TiledDetector.from_config(
+        StubBatchDetector(per_tile=lambda index: []),
+        settings.model,
+        settings.tiling,
+        frame_width=1280,
+        frame_height=960,
+    )
+
+    assert tiled.iou_threshold == pytest.approx(0.3)
+    assert tiled.tiling.batch_size == 2
+
+
+def test_tiling_config_rejects_overlap_larger_than_tile() -> None:
+    """Overlap must leave a positive stride between tiles."""
+
+    with pytest.raises(ValueError):
+        TilingConfig(tile_width=64, tile_height=64, overlap=64)
+
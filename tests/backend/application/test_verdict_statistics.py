@@ -0,0 +1,196 @@
+"""Tests for streaming NG statistics rollups."""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, List, Mapping, Optional
+
+import pytest
+
+from backend.application.verdict_statistics import VerdictStatistics, build_control_chart
+from backend.core.config import Settings, StatisticsConfig
+from backend.domain.entities import InspectionVerdict
+from backend.infrastructure.statistics_store import JsonStatisticsStore
+from backend.interfaces import StatisticsDTO
+
+OK = InspectionVerdict(status="OK", reason="ok")
+SCRATCH = InspectionVerdict(
+    status="NG", reason="ng", label="scratch", confidence=0.9, source="detection"
+)
+DENT = InspectionVerdict(status="NG", reason="ng", label="dent", confidence=0.8, source="classification")
+T0 = datetime(2026, 3, 2, 13, 30)
+
+
+@pytest.fixture()
+def statistics() -> VerdictStatistics:
+    """Provide statistics populated with a few verdicts across two hours and cameras."""
+
+    stats = VerdictStatistics(StatisticsConfig(compaction_interval=3600))
+    stats.record(OK, camera="cam1", timestamp=T0)
+    stats.record(SCRATCH, camera="cam1", timestamp=T0 + timedelta(seconds=5))
+    stats.record(DENT, camera="cam2", timestamp=T0 + timedelta(minutes=1))
+    stats.record(OK, camera="cam2", timestamp=T0 + timedelta(minutes=40))
+    return stats
+
+
+def test_query_rolls_up_counts_per_hour(statistics: VerdictStatistics) -> None:
+    """Hourly buckets should aggregate counts across cameras and labels."""
+
+    buckets = statistics.query("hour", T0 - timedelta(hours=1), T0 + timedelta(hours=2))
+
+    assert [bucket.start.hour for bucket in buckets] == [13, 14]
+    assert (buckets[0].inspected, buckets[0].ng) == (3, 2)
+    assert buckets[0].ng_by_label == {"scratch": 1, "dent": 1}
+    assert buckets[0].ng_rate == pytest.approx(2 / 3)
+    assert (buckets[1].inspected, buckets[1].ng) == (1, 0)
+
+
+def test_query_filters_by_camera_label_and_source(statistics: VerdictStatistics) -> None:
+    """Filters restrict NG counts and the camera filter also restricts the denominator."""
+
+    start, end = T0 - timedelta(hours=1), T0 + timedelta(hours=2)
+
+    by_camera = statistics.query("minute", start, end, camera="cam1")
+    by_label = statistics.query("hour", start, end, label="dent")
+    by_source = statistics.query("hour", start, end, source="detection")
+
+    assert [(bucket.inspected, bucket.ng) for bucket in by_camera] == [(2, 1)]
+    assert by_label[0].ng_by_label == {"dent": 1}
+    assert by_source[0].ng_by_label == {"scratch": 1}
+
+
+def test_shift_buckets_follow_configured_start_hours() -> None:
+    """Verdicts before the first shift belong to the previous day's last shift."""
+
+    stats = VerdictStatistics(StatisticsConfig(shift_start_hours=(22, 6, 14)))
+
+    assert stats.bucket_start("shift", T0) == datetime(2026, 3, 2, 6)
+    assert stats.bucket_start("shift", datetime(2026, 3, 2, 3, 15)) == datetime(2026, 3, 1, 22)
+    with pytest.raises(ValueError):
+        stats.bucket_start("week", T0)
+
+
+def test_control_chart_flags_buckets_outside_limits() -> None:
+    """A bucket far above the average NG rate should be out of control."""
+
+    stats = VerdictStatistics()
+    for minute in range(10):
+        timestamp = T0 + timedelta(minutes=minute)
+        for item in range(100):
+            verdict = SCRATCH if item < (60 if minute == 9 else 5) else OK
+            stats.record(verdict, camera="cam1", timestamp=timestamp)
+
+    chart = build_control_chart(stats.query("minute", T0, T0 + timedelta(hours=1)))
+
+    assert chart.center_line == pytest.approx(105 / 1000)
+    assert [point.out_of_control for point in chart.points] == [False] * 9 + [True]
+    assert all(point.lower_limit <= chart.center_line <= point.upper_limit for point in chart.points)
+
+
+def test_compaction_evicts_expired_buckets_and_persists_snapshot(tmp_path: Path) -> None:
+    """Compaction should drop stale minute buckets and restore state on restart."""
+
+    store = JsonStatisticsStore(tmp_path / "statistics.json")
+    config = StatisticsConfig(compaction_interval=60, minute_retention_hours=1)
+    stats = VerdictStatistics(config, store=store)
+    stats.record(SCRATCH, camera="cam1", timestamp=T0)
+    stats.record(OK, camera="cam1", timestamp=T0 + timedelta(hours=2))
+    stats.wait_for_compaction()
+
+    restored = VerdictStatistics(config, store=store)
+    assert restored.load()
+    window = (T0 - timedelta(days=1), T0 + timedelta(days=1))
+
+    assert [bucket.start for bucket in restored.query("minute", *window)] == [T0 + timedelta(hours=2)]
+    assert [bucket.ng for bucket in restored.query("hour", *window)] == [1, 0]
+
+
+def test_statistics_dto_combines_buckets_with_control_limits(statistics: VerdictStatistics) -> None:
+    """The API DTO should expose counts, rates, and limits per bucket."""
+
+    buckets = statistics.query("hour", T0 - timedelta(hours=1), T0 + timedelta(hours=2))
+
+    payload = StatisticsDTO.from_domain("hour", buckets, build_control_chart(buckets)).model_dump()
+
+    assert payload["granularity"] == "hour"
+    assert payload["center_line"] == pytest.approx(0.5)
+    assert payload["buckets"][0]["start"] == "2026-03-02T13:00:00"
+    assert payload["buckets"][0]["ng_by_label"] == {"scratch": 1, "dent": 1}
+    assert payload["buckets"][1]["out_of_control"] is False
+
+
+def test_timezone_aware_timestamps_share_local_buckets() -> None:
+    """Aware timestamps should be bucketed and queried as local time."""
+
+    stats = VerdictStatistics()
+    local = T0.astimezone()
+    stats.record(SCRATCH, camera="cam1", timestamp=T0)
+    stats.record(OK, camera="cam1", timestamp=local.astimezone(timezone.utc) + timedelta(seconds=1))
+
+    buckets = stats.query(
+        "minute", local - timedelta(minutes=5), (local + timedelta(minutes=5)).astimezone(timezone.utc)
+    )
+
+    assert [(bucket.start, bucket.inspected, bucket.ng) for bucket in buckets] == [(T0, 2, 1)]
+
+
+def test_query_walks_only_the_retained_range() -> None:
+    """Unbounded ranges are clipped to retention and shift buckets are stepped in order."""
+
+    stats = VerdictStatistics(StatisticsConfig(shift_retention_days=2))
+    for hours in (-30, -10, 0, 9):
+        stats.record(SCRATCH, camera="cam1", timestamp=T0 + timedelta(hours=hours))
+
+    shifts = stats.query("shift", datetime.min, datetime.max)
+
+    assert [bucket.start for bucket in shifts] == [
+        datetime(2026, 3, 1, 6),
+        datetime(2026, 3, 1, 22),
+        datetime(2026, 3, 2, 6),
+        datetime(2026, 3, 2, 22),
+    ]
+    assert stats.query("hour", T0 + timedelta(minutes=1), T0 + timedelta(hours=1)) == []
+
+
+class _RecordingStore:
+    """Store counting saves, optionally blocking them until released."""
+
+    def __init__(self) -> None:
+        self.saves: List[Mapping[str, Any]] = []
+        self.release = threading.Event()
+
+    def save(self, snapshot: Mapping[str, Any]) -> None:
+        self.release.wait(5)
+        self.saves.append(snapshot)
+
+    def load(self) -> Optional[Mapping[str, Any]]:
+        return None
+
+
+def test_due_compaction_runs_once_off_the_recording_thread() -> None:
+    """Recording must not wait for a slow save nor start overlapping compactions."""
+
+    store = _RecordingStore()
+    stats = VerdictStatistics(StatisticsConfig(compaction_interval=60), store=store)
+    stats.record(OK, camera="cam1", timestamp=T0)
+
+    for seconds in (61, 62, 63):
+        stats.record(SCRATCH, camera="cam1", timestamp=T0 + timedelta(seconds=seconds))
+    assert store.saves == []
+
+    store.release.set()
+    stats.wait_for_compaction(5)
+    assert len(store.saves) == 1
+
+
+def test_settings_place_snapshot_in_data_dir() -> None:
+    """The default snapshot follows ``data_dir`` and a null section keeps defaults."""
+
+    settings = Settings.from_dict({"data_dir": "/srv/rqi", "statistics": None})
+    explicit = Settings.from_dict({"statistics": {"snapshot_path": "/tmp/stats.json"}})
+
+    assert settings.statistics.snapshot_path == Path("/srv/rqi/statistics.json")
+    assert settings.statistics.compaction_interval == StatisticsConfig().compaction_interval
+    assert explicit.statistics.snapshot_path == Path("/tmp/stats.json")
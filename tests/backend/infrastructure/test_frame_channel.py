@@ -0,0 +1,179 @@
+"""Tests for the shared-memory frame channel."""
+
+from __future__ import annotations
+
+import uuid
+from typing import Iterator
+
+import pytest
+
+from backend.core.config import RTSPSource
+from backend.domain.entities import DetectionResult, InspectionVerdict
+from backend.infrastructure.frame_channel import (
+    SharedFramePublisher,
+    SharedFrameReader,
+    SharedFrameWriter,
+)
+
+
+@pytest.fixture()
+def camera() -> str:
+    """Provide a unique camera name so shared-memory blocks never collide."""
+
+    return f"test_{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture()
+def writer(camera: str) -> Iterator[SharedFrameWriter]:
+    """Create a writer and remove its block after the test."""
+
+    channel = SharedFrameWriter(camera, frame_capacity=64, metadata_capacity=4096)
+    yield channel
+    channel.close()
+
+
+def test_reader_returns_latest_frame_with_verdict_and_detections(
+    camera: str, writer: SharedFrameWriter
+) -> None:
+    """Readers should see the most recent frame together with its metadata."""
+
+    reader = SharedFrameReader(camera)
+    verdict = InspectionVerdict(
+        status="NG", reason="Detected NG label", label="scratch", confidence=0.9, source="detection"
+    )
+    detection = DetectionResult(label="scratch", confidence=0.9, mask=b"\x01\x00", bbox=(1, 2, 2, 1))
+
+    assert reader.read() is None
+
+    writer.publish(b"\x00" * 12, 2, 2, 3, InspectionVerdict(status="OK", reason="ok"), timestamp=1.0)
+    sequence = writer.publish(b"\x07" * 12, 2, 2, 3, verdict, [detection], timestamp=2.0)
+    frame = reader.read()
+    reader.close()
+
+    assert frame is not None
+    assert frame.sequence == sequence == 2
+    assert frame.generation == writer.generation
+    assert frame.timestamp == pytest.approx(2.0)
+    assert (frame.width, frame.height, frame.channels) == (2, 2, 3)
+    assert frame.pixels == b"\x07" * 12
+    assert frame.verdict == verdict
+    assert frame.detections == (detection,)
+
+
+def test_reader_skips_frames_it_has_already_seen(camera: str, writer: SharedFrameWriter) -> None:
+    """Reading with the current sequence should not copy the frame again."""
+
+    reader = SharedFrameReader(camera)
+    sequence = writer.publish(b"\x01" * 4, 2, 2, 1, InspectionVerdict(status="OK", reason="ok"))
+
+    assert reader.read(after_sequence=sequence, generation=writer.generation) is None
+    reader.close()
+
+
+def test_writer_rejects_frames_exceeding_capacity(writer: SharedFrameWriter) -> None:
+    """Frames larger than the slot must be refused."""
+
+    with pytest.raises(ValueError):
+        writer.publish(b"\x00" * 65, 65, 1, 1, InspectionVerdict(status="OK", reason="ok"))
+
+
+def test_writer_drops_masks_that_exceed_metadata_capacity(camera: str) -> None:
+    """Oversized masks should degrade to boxes instead of failing the publish."""
+
+    writer = SharedFrameWriter(camera, frame_capacity=4, metadata_capacity=512)
+    reader = SharedFrameReader(camera)
+    detection = DetectionResult(label="scratch", confidence=0.9, mask=b"\x01" * 4096, bbox=(0, 0, 64, 64))
+    verdict = InspectionVerdict(status="NG", reason="ng", label="scratch")
+
+    writer.publish(b"\x00" * 4, 2, 2, 1, verdict, [detection])
+    frame = reader.read()
+    reader.close()
+    writer.close()
+
+    assert frame is not None
+    assert frame.detections[0].bbox == (0, 0, 64, 64)
+    assert frame.detections[0].mask == b""
+
+
+def test_restarted_writer_is_seen_by_an_attached_reader(camera: str) -> None:
+    """A writer reusing a leftover block announces itself with a new generation."""
+
+    first = SharedFrameWriter(camera, frame_capacity=4)
+    reader = SharedFrameReader(camera)
+    ok = InspectionVerdict(status="OK", reason="ok")
+    for _ in range(3):
+        first.publish(b"\x01" * 4, 2, 2, 1, ok)
+    seen = reader.read()
+    assert seen is not None and seen.sequence == 3
+
+    second = SharedFrameWriter(camera, frame_capacity=4)
+    second.publish(b"\x02" * 4, 2, 2, 1, ok)
+    frame = reader.read(after_sequence=seen.sequence, generation=seen.generation)
+    reader.close()
+    second.close()
+    first.close()
+
+    assert frame is not None
+    assert (frame.sequence, frame.generation) == (1, second.generation)
+    assert frame.pixels == b"\x02" * 4
+
+
+def test_publisher_only_publishes_configured_cameras_with_matching_frames(camera: str) -> None:
+    """Unknown cameras and mismatched frames are skipped without raising."""
+
+    publisher = SharedFramePublisher(
+        [
+            RTSPSource(name=camera, url="rtsp://cam", frame_width=2, frame_height=2, channels=1),
+            RTSPSource(name=f"{camera}_raw", url="rtsp://raw"),
+        ]
+    )
+    reader = SharedFrameReader(camera)
+    ok = InspectionVerdict(status="OK", reason="ok")
+
+    publisher.publish("unknown", b"\x00" * 4, ok, [])
+    publisher.publish(camera, b"\x00" * 3, ok, [])
+    assert reader.read() is None
+
+    publisher.publish(camera, b"\x05" * 4, ok, [])
+    frame = reader.read()
+    reader.close()
+    publisher.close()
+
+    assert frame is not None and frame.pixels == b"\x05" * 4
+
+
+def test_writer_omits_masks_for_ok_verdicts(camera: str, writer: SharedFrameWriter) -> None:
+    """Masks are only drawn for NG frames, so OK frames publish boxes alone."""
+
+    reader = SharedFrameReader(camera)
+    detection = DetectionResult(label="scratch", confidence=0.3, mask=b"\x01\x01", bbox=(0, 0, 2, 1))
+
+    writer.publish(b"\x00" * 4, 2, 2, 1, InspectionVerdict(status="OK", reason="ok"), [detection])
+    frame = reader.read()
+    reader.close()
+
+    assert frame is not None
+    assert [(entry.bbox, entry.mask) for entry in frame.detections] == [((0, 0, 2, 1), b"")]
+
+
+def test_publisher_limits_frames_to_the_display_rate(camera: str) -> None:
+    """Frames arriving faster than ``max_rate`` are not copied into the channel."""
+
+    now = [0.0]
+    publisher = SharedFramePublisher(
+        [RTSPSource(name=camera, url="rtsp://cam", frame_width=2, frame_height=2, channels=1)],
+        max_rate=10.0,
+        clock=lambda: now[0],
+    )
+    reader = SharedFrameReader(camera)
+    ok = InspectionVerdict(status="OK", reason="ok")
+
+    for step in range(5):
+        now[0] = step * 0.04
+        publisher.publish(camera, bytes([step]) * 4, ok, [])
+    frame = reader.read()
+    reader.close()
+    publisher.close()
+
+    assert frame is not None
+    assert (frame.sequence, frame.pixels) == (2, b"\x03" * 4)
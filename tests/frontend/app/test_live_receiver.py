@@ -0,0 +1,181 @@
+"""Tests for the Qt-independent live view receiver and state."""
+
+from __future__ import annotations
+
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import pytest
+
+from backend.domain.entities import DetectionResult, InspectionVerdict
+from backend.infrastructure.frame_channel import SharedFrame, SharedFrameWriter
+from frontend.app.live.receiver import FrameReceiver, SharedMemoryFrameSource
+from frontend.app.live.state import LatestFrameMailbox, RateMeter, overlay_detections
+
+
+def _frame(
+    sequence: int, verdict: Optional[InspectionVerdict] = None, detections=(), generation: int = 1
+) -> SharedFrame:
+    """Build a tiny frame with the given sequence number."""
+
+    return SharedFrame(
+        sequence=sequence,
+        generation=generation,
+        timestamp=0.0,
+        width=1,
+        height=1,
+        channels=1,
+        pixels=b"\x00",
+        verdict=verdict or InspectionVerdict(status="OK", reason="ok"),
+        detections=tuple(detections),
+    )
+
+
+@dataclass
+class StubFrameSource:
+    """Frame source returning the configured latest sequence per camera."""
+
+    latest: Dict[str, int]
+    generation: int = 1
+    requests: List[int] = field(default_factory=list)
+    failing: Dict[str, Exception] = field(default_factory=dict)
+    resets: List[str] = field(default_factory=list)
+
+    def read(self, camera: str, after_sequence: int, generation: int) -> Optional[SharedFrame]:
+        self.requests.append(after_sequence)
+        if camera in self.failing:
+            raise self.failing.pop(camera)
+        sequence = self.latest.get(camera, 0)
+        if sequence and (generation != self.generation or sequence > after_sequence):
+            return _frame(sequence, generation=self.generation)
+        return None
+
+    def reset(self, camera: str) -> None:
+        self.resets.append(camera)
+
+
+def test_receiver_hands_only_newest_frames_to_mailbox() -> None:
+    """Frames published between polls are skipped and counted."""
+
+    source = StubFrameSource(latest={"cam1": 1, "cam2": 0})
+    mailbox = LatestFrameMailbox()
+    receiver = FrameReceiver(source, ["cam1", "cam2"], mailbox)
+
+    assert receiver.poll_once() == 1
+    source.latest["cam1"] = 5
+    assert receiver.poll_once() == 1
+    assert receiver.poll_once() == 0
+
+    frames = mailbox.take_all()
+    assert list(frames) == ["cam1"]
+    assert frames["cam1"].sequence == 5
+    assert receiver.skipped("cam1") == 3
+    assert mailbox.take_all() == {}
+
+
+def test_receiver_follows_restarted_writer_and_prepares_frames() -> None:
+    """A new writer generation resets the cursor and frames pass through ``prepare``."""
+
+    source = StubFrameSource(latest={"cam1": 7})
+    mailbox = LatestFrameMailbox()
+    receiver = FrameReceiver(
+        source, ["cam1"], mailbox, prepare=lambda camera, frame: (camera, frame.sequence)
+    )
+
+    receiver.poll_once()
+    source.latest["cam1"], source.generation = 1, 2
+    receiver.poll_once()
+
+    assert mailbox.take_all() == {"cam1": ("cam1", 1)}
+    assert receiver.skipped("cam1") == 0
+
+
+def test_receiver_survives_failing_cameras() -> None:
+    """A read or prepare error must not stop polling the other cameras or the thread."""
+
+    source = StubFrameSource(latest={"cam1": 1, "cam2": 1}, failing={"cam1": ValueError("bad metadata")})
+    mailbox = LatestFrameMailbox()
+
+    def prepare(camera: str, frame: SharedFrame) -> SharedFrame:
+        if camera == "cam2" and frame.sequence == 1:
+            raise RuntimeError("cannot scale")
+        return frame
+
+    receiver = FrameReceiver(source, ["cam1", "cam2"], mailbox, refresh_rate=1000.0, prepare=prepare)
+    receiver.start()
+    try:
+        deadline = time.monotonic() + 5
+        while "cam1" not in mailbox.take_all() and time.monotonic() < deadline:
+            time.sleep(0.005)
+        source.latest["cam2"] = 2
+        frames: Dict[str, SharedFrame] = {}
+        while "cam2" not in frames and time.monotonic() < deadline:
+            frames.update(mailbox.take_all())
+            time.sleep(0.005)
+        assert receiver._thread is not None and receiver._thread.is_alive()
+    finally:
+        receiver.stop()
+
+    assert frames["cam2"].sequence == 2
+    assert source.resets == ["cam1", "cam2"]
+
+
+def test_shared_memory_source_reattaches_after_backend_restart() -> None:
+    """A reader left on an unlinked block should pick up the restarted writer."""
+
+    camera = f"test_{uuid.uuid4().hex[:8]}"
+    ok = InspectionVerdict(status="OK", reason="ok")
+    source = SharedMemoryFrameSource(stale_after=0.0)
+    first = SharedFrameWriter(camera, frame_capacity=4)
+    first.publish(b"\x01" * 4, 2, 2, 1, ok)
+    seen = source.read(camera, 0, 0)
+    assert seen is not None
+    first.close()
+
+    second = SharedFrameWriter(camera, frame_capacity=4)
+    second.publish(b"\x02" * 4, 2, 2, 1, ok)
+    frames = [source.read(camera, seen.sequence, seen.generation) for _ in range(2)]
+    source.close()
+    second.close()
+
+    restarted = [frame for frame in frames if frame is not None]
+    assert [frame.pixels for frame in restarted] == [b"\x02" * 4]
+
+
+def test_receiver_rejects_non_positive_refresh_rate() -> None:
+    """A refresh rate of zero cannot be paced."""
+
+    with pytest.raises(ValueError):
+        FrameReceiver(StubFrameSource(latest={}), ["cam1"], LatestFrameMailbox(), refresh_rate=0)
+
+
+def test_rate_meter_reports_fps_and_latency_within_window() -> None:
+    """Samples older than the window are discarded."""
+
+    now = [0.0]
+    meter = RateMeter(window=1.0, clock=lambda: now[0])
+    for latency in (0.01, 0.03):
+        meter.record(latency)
+        now[0] += 0.25
+
+    fps, latency_ms = meter.snapshot()
+    assert fps == pytest.approx(2.0)
+    assert latency_ms == pytest.approx(20.0)
+
+    now[0] = 5.0
+    assert meter.snapshot() == (0.0, 0.0)
+
+
+def test_overlay_detections_only_for_ng_frames() -> None:
+    """OK frames draw no masks and NG frames prefer detections matching the verdict."""
+
+    scratch = DetectionResult(label="scratch", confidence=0.9, mask=b"\x01", bbox=(0, 0, 1, 1))
+    dent = DetectionResult(label="dent", confidence=0.4, mask=b"\x01", bbox=(0, 0, 1, 1))
+    ng = InspectionVerdict(status="NG", reason="ng", label="scratch")
+    classified = InspectionVerdict(status="NG", reason="ng", label="chip", source="classification")
+
+    assert overlay_detections(_frame(1, detections=[scratch, dent])) == ()
+    assert overlay_detections(_frame(1, ng, [scratch, dent])) == (scratch,)
+    assert overlay_detections(_frame(1, classified, [scratch, dent])) == (scratch, dent)
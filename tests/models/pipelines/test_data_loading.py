@@ -0,0 +1,193 @@
+"""Tests for the shared sharded training data loader."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from models.pipelines.data_loading import (
+    Batch,
+    DataLoaderConfig,
+    LoaderCursor,
+    Sample,
+    ShardedDataLoader,
+    run_training,
+)
+
+IMAGE_SIZE = (2, 2, 1)
+DECODED: List[Path] = []
+
+
+def fill_decoder(path: Path, image_size: tuple) -> bytes:
+    """Decode a fake image whose single byte fills the whole record."""
+
+    DECODED.append(path)
+    width, height, channels = image_size
+    return path.read_bytes()[:1] * (width * height * channels)
+
+
+@pytest.fixture()
+def samples(tmp_path: Path) -> List[Sample]:
+    """Create ten fake images whose pixel value equals their target."""
+
+    DECODED.clear()
+    images = tmp_path / "images"
+    images.mkdir()
+    result = []
+    for index in range(10):
+        path = images / f"{index}.img"
+        path.write_bytes(bytes([index]))
+        result.append(Sample(path=path, target=index))
+    return result
+
+
+def _config(**overrides: object) -> DataLoaderConfig:
+    options = dict(image_size=IMAGE_SIZE, batch_size=3, workers=0, shard_size=4, seed=7)
+    options.update(overrides)
+    return DataLoaderConfig(**options)  # type: ignore[arg-type]
+
+
+def _targets(batches: List[Batch]) -> List[int]:
+    return [target for batch in batches for target in batch.targets]
+
+
+def test_loader_decodes_once_and_reads_shards_afterwards(samples: List[Sample], tmp_path: Path) -> None:
+    """The first epoch builds the cache; later epochs must not decode again."""
+
+    loader = ShardedDataLoader(samples, tmp_path / "cache", _config(), decode=fill_decoder)
+    batches: List[Batch] = []
+
+    stats = loader.run(epochs=2, train_step=batches.append)
+
+    assert len(DECODED) == 10
+    assert len(loader) == 4
+    assert [entry.cache_built for entry in stats] == [True, False]
+    assert [entry.samples for entry in stats] == [10, 10]
+    assert all(entry.samples_per_second > 0 for entry in stats)
+    for batch in batches:
+        assert batch.pixels == b"".join(bytes([target]) * 4 for target in batch.targets)
+    assert sorted(_targets(batches[:4])) == list(range(10))
+    assert _targets(batches[:4]) != _targets(batches[4:])
+    assert len(list((tmp_path / "cache").glob("shard-*.bin"))) == 3
+
+
+def test_threaded_prefetch_matches_in_process_reads(samples: List[Sample], tmp_path: Path) -> None:
+    """Prefetch threads should deliver the same batches in the same order."""
+
+    serial = ShardedDataLoader(samples, tmp_path / "cache", _config(), decode=fill_decoder)
+    parallel = ShardedDataLoader(
+        samples, tmp_path / "cache", _config(workers=2, prefetch=2), decode=fill_decoder
+    )
+
+    expected = [(batch.pixels, batch.targets) for batch in serial.epoch(1)]
+    actual = [(batch.pixels, batch.targets) for batch in parallel.epoch(1)]
+
+    assert actual == expected
+
+
+def test_abandoned_epoch_stops_prefetching(samples: List[Sample], tmp_path: Path) -> None:
+    """Closing an epoch early should shut the prefetch threads down."""
+
+    loader = ShardedDataLoader(
+        samples, tmp_path / "cache", _config(workers=4, prefetch=3), decode=fill_decoder
+    )
+    batches = loader.epoch(0)
+    first = next(batches)
+    batches.close()
+
+    assert first.size == 3
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("shard-reader")]
+
+
+def test_loader_resumes_mid_epoch_from_cursor(samples: List[Sample], tmp_path: Path) -> None:
+    """An interrupted run should replay exactly the remaining batches."""
+
+    cursor_path = tmp_path / "cursor.json"
+    config = _config(checkpoint_every=1)
+    expected = _targets(list(ShardedDataLoader(samples, tmp_path / "cache", config, fill_decoder).epoch(0)))
+    seen: List[Batch] = []
+
+    def failing_step(batch: Batch) -> None:
+        if len(seen) == 2:
+            raise RuntimeError("interrupted")
+        seen.append(batch)
+
+    loader = ShardedDataLoader(samples, tmp_path / "cache", config, decode=fill_decoder)
+    with pytest.raises(RuntimeError):
+        loader.run(epochs=1, train_step=failing_step, cursor_path=cursor_path)
+    assert LoaderCursor.load(cursor_path) == LoaderCursor(epoch=0, batch=2)
+
+    resumed: List[Batch] = []
+    stats = loader.run(epochs=1, train_step=resumed.append, cursor_path=cursor_path, resume=True)
+
+    assert _targets(seen) + _targets(resumed) == expected
+    assert stats[0].samples == 4
+    assert LoaderCursor.load(cursor_path) == LoaderCursor(epoch=1, batch=0)
+
+
+def test_cache_is_rebuilt_when_samples_change(samples: List[Sample], tmp_path: Path) -> None:
+    """Changing targets invalidates previously cached shards."""
+
+    ShardedDataLoader(samples, tmp_path / "cache", _config(), decode=fill_decoder).ensure_cache()
+    relabelled = [Sample(path=sample.path, target=sample.target + 1) for sample in samples]
+
+    rebuilt = ShardedDataLoader(relabelled, tmp_path / "cache", _config(), decode=fill_decoder)
+
+    assert rebuilt.ensure_cache() is True
+    assert rebuilt.ensure_cache() is False
+    assert len(DECODED) == 20
+
+
+def test_loader_config_reads_project_manifest_entry() -> None:
+    """Batch size falls back to the model hyperparameters."""
+
+    config = DataLoaderConfig.from_model_config(
+        {"hyperparameters": {"batch_size": 16}, "data": {"image_size": [64, 32, 3], "workers": 0}}
+    )
+
+    assert (config.batch_size, config.image_size, config.workers) == (16, (64, 32, 3), 0)
+    with pytest.raises(ValueError):
+        DataLoaderConfig(image_size=(0, 1, 3))
+
+
+def test_run_training_checkpoints_model_state_and_writes_metrics(
+    samples: List[Sample], tmp_path: Path
+) -> None:
+    """The checkpoint hook sees every saved cursor so model state can follow it."""
+
+    config = {
+        "paths": {"artifacts_root": str(tmp_path / "artifacts"), "dataset_root": str(tmp_path)},
+        "models": {
+            "classifier": {
+                "hyperparameters": {"epochs": 1, "batch_size": 3},
+                "data": {"image_size": list(IMAGE_SIZE), "workers": 0, "checkpoint_every": 2},
+            }
+        },
+    }
+    cursors: List[LoaderCursor] = []
+
+    stats = run_training(
+        config, "classifier", samples, lambda batch: None, on_checkpoint=cursors.append, decode=fill_decoder
+    )
+
+    assert [entry.samples for entry in stats] == [10]
+    assert cursors == [LoaderCursor(epoch=0, batch=2), LoaderCursor(epoch=1, batch=0)]
+    assert (tmp_path / "artifacts" / "classifier" / "loader_cursor.json").exists()
+    assert list((tmp_path / "artifacts" / "experiments").glob("*/metrics.json"))
+    with pytest.raises(ValueError):
+        run_training(config, "classifier", [], decode=fill_decoder)
+
+
+def test_unreadable_cache_index_triggers_rebuild(samples: List[Sample], tmp_path: Path) -> None:
+    """A truncated index left by a crash is treated as missing, not as an error."""
+
+    loader = ShardedDataLoader(samples, tmp_path / "cache", _config(), decode=fill_decoder)
+    loader.ensure_cache()
+    (tmp_path / "cache" / "index.json").write_text('{"fingerprint": "ab', encoding="utf-8")
+
+    assert loader.ensure_cache() is True
+    assert loader.ensure_cache() is False
+    assert not list((tmp_path / "cache").glob("*.tmp"))